@@ -3,6 +3,11 @@ import re
 from bdt_common.constants import LEVERAGE_EXCLUDES, LEVERAGE_SUFFIXES, QUOTES, STABLECOINS
 from bdt_common.enums import ContractType
 
+# SP_{number} prefix that appears when symbols are delisted/relisted in BHDS, compiled once
+# instead of going through the re module cache on every symbol
+SP_PREFIX_PATTERN = re.compile(r"^SP\d+_")
+
+
 def infer_spot_info(symbol: str) -> dict | None:
     """
     Infer spot trading pair information from a given symbol.
@@ -28,7 +33,7 @@ def infer_spot_info(symbol: str) -> dict | None:
     symbol_original = symbol
 
     # Remove SP_{number} prefix that appears when symbols are delisted/relisted in BHDS
-    symbol = re.sub(r"^SP\d+_", "", symbol)
+    symbol = SP_PREFIX_PATTERN.sub("", symbol)
     for quote in QUOTES:
         if symbol.endswith(quote):
             base = symbol[: -len(quote)]
@@ -70,7 +75,7 @@ def infer_um_futures_info(symbol: str):
     symbol_original = symbol
 
     # Remove SP_{number} prefix that appears when symbols are delisted/relisted in BHDS
-    symbol = re.sub(r"^SP\d+_", "", symbol)
+    symbol = SP_PREFIX_PATTERN.sub("", symbol)
 
     # Determine contract type based on underscore suffix
     # Delivery contracts have expiration date suffix (e.g., "_240927" for September 27, 2024)
@@ -126,7 +131,7 @@ def infer_cm_futures_info(symbol: str):
     symbol_original = symbol
 
     # Remove SP_{number} prefix that appears when symbols are delisted/relisted in BHDS
-    symbol = re.sub(r"^SP\d+_", "", symbol)
+    symbol = SP_PREFIX_PATTERN.sub("", symbol)
 
     # Split symbol into underlying asset and contract suffix
     underlying, suffix = symbol.split("_")
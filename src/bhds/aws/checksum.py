@@ -1,12 +1,42 @@
 import hashlib
+import mmap
 import multiprocessing as mp
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 from tqdm import tqdm
 
 from bdt_common.log_kit import logger
+from bhds.aws.verified_manifest import VerifiedEntry, VerifiedManifest
+
+# SHA256 hex digest length, and how much of a checksum file is read to find it
+SHA256_HEX_LENGTH = 64
+CHECKSUM_READ_SIZE = 80
+
+# Files smaller than this are verified in groups to amortize per-task scheduling overhead
+SMALL_FILE_SIZE = 1 << 20
+SMALL_FILE_BATCH_SIZE = 32
+
+# Pre-validation of more checksum files than this is spread over a thread pool
+PARALLEL_PREVALIDATION_MIN_FILES = 1000
+
+# Files at least this large get a parallel fingerprint recorded on their first re-check, so later
+# re-checks skip the full SHA256
+FINGERPRINT_MIN_SIZE = 256 << 20
+
+# Block hashing threads of one fingerprint, at least two so reading blocks overlaps hashing
+FINGERPRINT_THREADS = max(2, min(8, mp.cpu_count()))
+
+# Error reported by ChecksumVerifier when a data file does not match its checksum file, any other
+# error is an exception message
+CHECKSUM_MISMATCH = "Checksum mismatch"
 
 
 def get_checksum_file(data_file: Path) -> Path:
@@ -23,109 +53,304 @@ def get_checksum_file(data_file: Path) -> Path:
     return checksum_file
 
 
-def get_verified_file(data_file: Path) -> Path:
+def is_verified(data_file: Path) -> bool:
     """
-    Get the path to the verification mark file corresponding to a data file.
+    Check whether a data file is marked as verified in its directory manifest and unchanged since.
 
     Args:
         data_file: Path to the data file
 
     Returns:
-        Path to the .verified file in the same directory as the data file
+        True if the data file does not need to be re-verified
     """
-    verified_file = data_file.parent / (data_file.name + ".verified")
-    return verified_file
+    entries = VerifiedManifest(data_file.parent).get_many([data_file.name])
+    entry = entries.get(data_file.name)
+    try:
+        return entry is not None and entry.matches(data_file.stat())
+    except FileNotFoundError:
+        return False
 
 
-def calc_checksum(data_file: Path) -> str:
+def calc_checksum(data_file: Path) -> bytes:
     """
-    Calculate SHA256 checksum of the file by reading the file content and computing its SHA256 hash.
+    Calculate SHA256 checksum of the file by streaming it through hashlib.file_digest.
+
+    The file is read through a fixed-size buffer, so memory usage stays flat regardless of file
+    size. hashlib delegates to OpenSSL (>= 1.1.1), which uses the SHA-NI instructions when the
+    CPU supports them (``grep -o sha_ni /proc/cpuinfo`` on Linux).
 
     Args:
         data_file: Path to the file to calculate checksum for
 
     Returns:
-        SHA256 checksum as a hexadecimal string
+        Raw SHA256 digest (32 bytes)
     """
-    with open(data_file, "rb") as file_to_check:
-        data = file_to_check.read()
-        checksum_value = hashlib.sha256(data).hexdigest()
+    with open(data_file, "rb", buffering=0) as f:
+        if hasattr(os, "posix_fadvise"):
+            # Ask the kernel for aggressive readahead before the file is read
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+        elif hasattr(fcntl, "F_NOCACHE"):
+            # macOS has no posix_fadvise, bypass the unified buffer cache for this fd instead
+            fcntl.fcntl(f.fileno(), fcntl.F_NOCACHE, 1)
+
+        checksum_value = hashlib.file_digest(f, "sha256").digest()
+
+        # Data files are read once here and not again for hours, drop them from the page cache
+        # so they do not evict hotter data such as parquet files being written
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
     return checksum_value
 
 
-def validate_and_cleanup_invalid_checksums(data_files: list[Path]) -> list[Path]:
+def _hash_block(mm: mmap.mmap, offset: int, size: int) -> bytes:
+    """Hash one block of a memory-mapped file, hashlib releases the GIL while hashing."""
+    with memoryview(mm)[offset : offset + size] as block:
+        return hashlib.sha256(block).digest()
+
+
+def calc_parallel_fingerprint(
+    data_file: Path, block_mb: int = 64, threads: int = 8
+) -> bytes:
     """
-    Fast pre-validation: Find and remove invalid checksum files (missing, empty, or corrupted).
+    Calculate a parallel SHA256 tree fingerprint of the file.
 
-    This avoids wasting time verifying data files when their checksums are already broken.
-    Invalid checksum files are deleted so they can be redownloaded.
+    The file is memory-mapped and split into fixed-size blocks hashed concurrently, and the
+    fingerprint is the SHA256 of the concatenated block digests. It is not the SHA256 published by
+    Binance, which stays the ground truth, but it is deterministic for a given block size and scales
+    with the number of threads, so it is used to re-check large files that already passed verification.
 
     Args:
-        data_files: List of data files to check
+        data_file: Path to the file to fingerprint
+        block_mb: Block size in MiB
+        threads: Number of hashing threads
 
     Returns:
-        List of data files whose checksum files are invalid (need redownload)
+        Raw fingerprint digest (32 bytes)
     """
-    invalid_files = []
+    block_size = block_mb << 20
+
+    with open(data_file, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        # Empty files cannot be memory-mapped, their fingerprint is the hash of no block digests
+        if file_size == 0:
+            return hashlib.sha256().digest()
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            offsets = range(0, file_size, block_size)
+            with ThreadPoolExecutor(max_workers=threads) as executor:
+                digests = executor.map(
+                    lambda offset: _hash_block(mm, offset, block_size), offsets
+                )
+                return hashlib.sha256(b"".join(digests)).digest()
+
+
+def _sha256_digest(block: bytes) -> bytes:
+    """Hash one block, hashlib releases the GIL while hashing."""
+    return hashlib.sha256(block).digest()
+
+
+def calc_checksum_and_fingerprint(
+    data_file: Path, block_mb: int = 64, threads: int = 8
+) -> tuple[bytes, bytes]:
+    """
+    Calculate both the SHA256 checksum and the parallel fingerprint of the file in a single read.
+
+    Each block is read once, hashed into the full SHA256 by the calling thread and into its block
+    digest on the thread pool. The fingerprint equals calc_parallel_fingerprint() with the same
+    block size.
+
+    Args:
+        data_file: Path to the file to hash
+        block_mb: Block size in MiB
+        threads: Number of block hashing threads
+
+    Returns:
+        Tuple of (raw SHA256 digest, raw fingerprint digest)
+    """
+    block_size = block_mb << 20
+    checksum = hashlib.sha256()
+
+    with open(data_file, "rb", buffering=0) as f:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            futures = []
+            while block := f.read(block_size):
+                futures.append(executor.submit(_sha256_digest, block))
+                checksum.update(block)
+            digests = [future.result() for future in futures]
+
+        # Same page cache policy as calc_checksum()
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+    return checksum.digest(), hashlib.sha256(b"".join(digests)).digest()
+
+
+def _detect_invalid_checksums_in_dir(
+    parent: Path, data_files: list[Path]
+) -> dict[Path, str]:
+    """
+    Find data files sharing the same parent directory whose checksum files are missing or broken.
+
+    The directory is listed once with os.scandir, so each data file costs a dict lookup instead of
+    separate exists() and stat() syscalls. Nothing is modified.
+
+    Args:
+        parent: Directory containing the data files
+        data_files: Data files located directly in parent
+
+    Returns:
+        Dictionary mapping data files with invalid checksum files to the reason
+    """
+    try:
+        with os.scandir(parent) as it:
+            entries = {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        entries = {}
+
+    invalid_files = {}
 
     for data_file in data_files:
         checksum_file = get_checksum_file(data_file)
 
-        # Check if checksum file is missing
-        if not checksum_file.exists():
-            logger.warning(
-                f"🗑️  Missing checksum file: {checksum_file.name}, marking for checksum redownload..."
-            )
-            # Do NOT delete data file, only redownload checksum
-            # Ensure verified marker is gone so it gets re-verified
-            get_verified_file(data_file).unlink(missing_ok=True)
-            invalid_files.append(data_file)
+        if checksum_file.name not in entries:
+            invalid_files[data_file] = "Missing checksum file"
             continue
 
-        # Check if checksum file is empty or too small (< 32 bytes for SHA256)
+        # Quick validation: parse the checksum from the first bytes of the file
         try:
-            file_size = checksum_file.stat().st_size
-            if file_size == 0:
-                logger.warning(
-                    f"🗑️  Empty checksum file: {checksum_file.name}, deleting..."
-                )
-                checksum_file.unlink()
-                # Do NOT delete data file, only redownload checksum
-                get_verified_file(data_file).unlink(missing_ok=True)
-                invalid_files.append(data_file)
+            with open(checksum_file, "rb") as f:
+                data = f.read(CHECKSUM_READ_SIZE)
+
+            if not data:
+                invalid_files[data_file] = "Empty checksum file"
                 continue
 
-            # Quick validation: try to read the checksum
-            with open(checksum_file, "r") as f:
-                content = f.read().strip()
+            _parse_checksum(data)
 
-            if not content or len(content.split()) == 0:
-                logger.warning(
-                    f"🗑️  Invalid checksum file: {checksum_file.name}, deleting..."
-                )
-                checksum_file.unlink()
-                # Do NOT delete data file
-                get_verified_file(data_file).unlink(missing_ok=True)
-                invalid_files.append(data_file)
+        except ValueError as e:
+            invalid_files[data_file] = f"Invalid checksum file ({e})"
 
         except Exception as e:
-            logger.warning(
-                f"🗑️  Corrupted checksum file: {checksum_file.name}, deleting... ({e})"
-            )
-            checksum_file.unlink(missing_ok=True)
-            # Do NOT delete data file
-            get_verified_file(data_file).unlink(missing_ok=True)
-            invalid_files.append(data_file)
+            invalid_files[data_file] = f"Corrupted checksum file ({e})"
+
+    return invalid_files
+
+
+def detect_invalid_checksums(data_files: list[Path]) -> dict[Path, str]:
+    """
+    Fast pre-validation: Find data files whose checksum files are missing, empty, or corrupted.
+
+    This avoids wasting time verifying data files when their checksums are already broken. Detection
+    is read-only, see cleanup_invalid_checksums() for removing the broken checksum files.
+
+    Args:
+        data_files: List of data files to check
+
+    Returns:
+        Dictionary mapping data files with invalid checksum files to the reason
+    """
+    # Group data files by directory so each directory is listed only once
+    files_by_dir: dict[Path, list[Path]] = {}
+    for data_file in data_files:
+        files_by_dir.setdefault(data_file.parent, []).append(data_file)
+
+    invalid_files = {}
+    if len(data_files) <= PARALLEL_PREVALIDATION_MIN_FILES or len(files_by_dir) == 1:
+        # Small runs are not worth the pool startup
+        for parent, dir_files in files_by_dir.items():
+            invalid_files.update(_detect_invalid_checksums_in_dir(parent, dir_files))
+    else:
+        # Directories are independent, threads overlap the latency of many tiny reads
+        n_workers = min(mp.cpu_count(), len(files_by_dir), 16)
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            for dir_invalid_files in executor.map(
+                _detect_invalid_checksums_in_dir,
+                files_by_dir.keys(),
+                files_by_dir.values(),
+            ):
+                invalid_files.update(dir_invalid_files)
+
+    return invalid_files
+
+
+def cleanup_invalid_checksums(invalid_files: dict[Path, str]) -> None:
+    """
+    Delete the broken checksum files found by detect_invalid_checksums() so they can be redownloaded.
+
+    Data files are NOT deleted, only their checksum files. They are removed from the verified
+    manifest so they get verified again after the redownload.
 
-    if invalid_files:
+    Args:
+        invalid_files: Dictionary mapping data files with invalid checksum files to the reason
+    """
+    if not invalid_files:
+        return
+
+    names_by_dir: dict[Path, list[str]] = {}
+    for data_file, reason in invalid_files.items():
+        checksum_file = get_checksum_file(data_file)
         logger.warning(
-            f"⚡ Pre-validation: Found {len(invalid_files)} invalid checksum files, deleted for redownload"
+            f"🗑️  {reason}: {checksum_file.name}, marking for checksum redownload..."
         )
+        checksum_file.unlink(missing_ok=True)
+        names_by_dir.setdefault(data_file.parent, []).append(data_file.name)
 
-    return invalid_files
+    # Ensure files with broken checksums get re-verified after redownload
+    for parent, names in names_by_dir.items():
+        VerifiedManifest(parent).remove(names)
 
+    logger.warning(
+        f"⚡ Pre-validation: Found {len(invalid_files)} invalid checksum files, deleted for redownload"
+    )
 
-def read_checksum(checksum_path: Path) -> str:
+
+def validate_and_cleanup_invalid_checksums(data_files: list[Path]) -> list[Path]:
+    """
+    Find and remove invalid checksum files (missing, empty, or corrupted).
+
+    Shorthand for detect_invalid_checksums() followed by cleanup_invalid_checksums().
+
+    Args:
+        data_files: List of data files to check
+
+    Returns:
+        List of data files whose checksum files are invalid (need redownload)
+    """
+    invalid_files = detect_invalid_checksums(data_files)
+    cleanup_invalid_checksums(invalid_files)
+    return list(invalid_files)
+
+
+def _parse_checksum(data: bytes) -> bytes:
+    """
+    Parse the SHA256 checksum from the leading bytes of a checksum file
+
+    Args:
+        data: Leading bytes of the checksum file, in the format "checksum_value filename"
+            or just "checksum_value"
+
+    Returns:
+        Raw SHA256 digest (32 bytes)
+
+    Raises:
+        ValueError: If there is no well-formed SHA256 hex digest
+    """
+    parts = data.split(maxsplit=1)
+    if not parts:
+        raise ValueError("Empty checksum file")
+
+    if len(parts[0]) != SHA256_HEX_LENGTH:
+        raise ValueError(f"Invalid checksum length {len(parts[0])}")
+
+    # Decoding as ASCII and bytes.fromhex reject anything that is not a hex digest
+    return bytes.fromhex(parts[0].decode("ascii"))
+
+
+def read_checksum(checksum_path: Path) -> bytes:
     """
     Read checksum value from checksum file
 
@@ -133,31 +358,19 @@ def read_checksum(checksum_path: Path) -> str:
         checksum_path: Path to the checksum file
 
     Returns:
-        Checksum value
+        Raw SHA256 digest (32 bytes), comparable with calc_checksum() directly
     """
-    if not checksum_path.exists():
+    try:
+        with open(checksum_path, "rb") as fin:
+            data = fin.read(CHECKSUM_READ_SIZE)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Checksum file {checksum_path} not exists")
+    except OSError as e:
+        raise RuntimeError(f"Invalid checksum file {checksum_path.name}: {e}")
 
     try:
-        with open(checksum_path, "r") as fin:
-            text = fin.read().strip()
-
-        if not text:
-            raise ValueError("Empty checksum file")
-
-        # Checksum file format: "checksum_value filename" or just "checksum_value"
-        parts = text.split()
-        if len(parts) == 0:
-            raise ValueError("Empty checksum file")
-        elif len(parts) == 1:
-            # Only checksum value, no filename
-            checksum_standard = parts[0]
-        else:
-            # Standard format: checksum_value filename
-            checksum_standard = parts[0]
-
-        return checksum_standard
-    except Exception as e:
+        return _parse_checksum(data)
+    except ValueError as e:
         raise RuntimeError(f"Invalid checksum file {checksum_path.name}: {e}")
 
 
@@ -170,24 +383,22 @@ class ChecksumVerifier:
 
         Args:
             delete_mismatch: Whether to delete file if verification fails
-            n_jobs: Number of parallel processes, defaults to CPU cores - 2
+            n_jobs: Number of worker threads, defaults to CPU cores - 2
         """
         self.delete_mismatch = delete_mismatch
         self.n_jobs = n_jobs or max(1, mp.cpu_count() - 2)
+        # Large files are re-checked one at a time, so each fingerprint gets all of its threads
+        self.fingerprint_threads = FINGERPRINT_THREADS
 
-    def verify_file(self, data_file: Path) -> bool:
+    def _check_file(self, data_file: Path) -> Optional[VerifiedEntry]:
         """
-        Verify checksum of a single file
-
-        IMPORTANT: This should ONLY be called after pre-validation.
-        Files with missing/empty checksums should be caught by validate_and_cleanup_invalid_checksums()
-        BEFORE reaching this method.
+        Verify checksum of a single file without updating the manifest
 
         Args:
             data_file: Path to the data file to verify
 
         Returns:
-            Success flag
+            Manifest record of the file if verification succeeded, None on checksum mismatch
 
         Raises:
             FileNotFoundError: If checksum file is missing (should be caught in pre-validation!)
@@ -207,19 +418,122 @@ class ChecksumVerifier:
             # Re-raise so the error gets logged properly
             raise
 
+        # Stat before hashing so a concurrent modification invalidates the record
+        stat_result = data_file.stat()
+
         checksum_value = calc_checksum(data_file)
 
         if checksum_value != checksum_standard:
             # Only delete if actual SHA256 mismatch (data file is corrupted)
             if self.delete_mismatch:
                 self._cleanup_files(data_file)
+            return None
+
+        return VerifiedEntry.from_stat(
+            data_file.name, stat_result, checksum_value.hex()
+        )
+
+    def verify_file(self, data_file: Path) -> bool:
+        """
+        Verify checksum of a single file
+
+        IMPORTANT: This should ONLY be called after pre-validation.
+        Files with missing/empty checksums should be caught by detect_invalid_checksums()
+        BEFORE reaching this method.
+
+        Args:
+            data_file: Path to the data file to verify
+
+        Returns:
+            Success flag
+
+        Raises:
+            FileNotFoundError: If checksum file is missing (should be caught in pre-validation!)
+            RuntimeError: If checksum file is invalid (should be caught in pre-validation!)
+        """
+        # Skip the expensive SHA256 recompute if the file was already verified and is unchanged
+        if is_verified(data_file):
+            return True
+
+        entry = self._check_file(data_file)
+        if entry is None:
             return False
 
-        # Create verification mark
-        verified_file = get_verified_file(data_file)
-        verified_file.touch()
+        VerifiedManifest(data_file.parent).mark([entry])
         return True
 
+    def _verify_batch(self, batch: list[Path]) -> tuple[int, dict[Path, str]]:
+        """
+        Verify a group of files sequentially inside one worker task
+
+        Manifest records are read and written once per directory for the whole batch.
+
+        Args:
+            batch: List of files to verify
+
+        Returns:
+            Tuple of (number of verified files, errors of the failed files)
+        """
+        files_by_dir: dict[Path, list[Path]] = {}
+        for data_file in batch:
+            files_by_dir.setdefault(data_file.parent, []).append(data_file)
+
+        n_success, errors = 0, {}
+        for directory, dir_files in files_by_dir.items():
+            manifest = VerifiedManifest(directory)
+            known_entries = manifest.get_many([f.name for f in dir_files])
+            new_entries = []
+
+            for data_file in dir_files:
+                try:
+                    # Skip the expensive SHA256 recompute if the file is unchanged since verified
+                    known_entry = known_entries.get(data_file.name)
+                    if known_entry is not None and known_entry.matches(
+                        data_file.stat()
+                    ):
+                        n_success += 1
+                        continue
+
+                    entry = self._check_file(data_file)
+                    if entry is None:
+                        errors[data_file] = CHECKSUM_MISMATCH
+                    else:
+                        new_entries.append(entry)
+                        n_success += 1
+                except Exception as e:
+                    errors[data_file] = str(e)
+
+            manifest.mark(new_entries)
+        return n_success, errors
+
+    @staticmethod
+    def _split_batches(files: list[Path]) -> list[list[Path]]:
+        """
+        Split files into worker tasks: one task per large file, small files grouped together
+
+        Args:
+            files: List of files to verify
+
+        Returns:
+            List of file batches
+        """
+        batches, small_files = [], []
+        for data_file in files:
+            try:
+                file_size = data_file.stat().st_size
+            except OSError:
+                # Let verify_file report the error
+                file_size = 0
+
+            if file_size < SMALL_FILE_SIZE:
+                small_files.append(data_file)
+            else:
+                batches.append([data_file])
+
+        for i in range(0, len(small_files), SMALL_FILE_BATCH_SIZE):
+            batches.append(small_files[i : i + SMALL_FILE_BATCH_SIZE])
+        return batches
+
     def verify_files(self, files: list[Path]) -> dict:
         """
         Batch verify files
@@ -236,31 +550,147 @@ class ChecksumVerifier:
             return results
 
         with tqdm(total=len(files), desc="Verifying files", unit="file") as pbar:
-            with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
-                future_to_file = {
-                    executor.submit(self.verify_file, f): f for f in files
-                }
-
-                for future in as_completed(future_to_file):
-                    file_path = future_to_file[future]
-                    try:
-                        success = future.result()
-                        if success:
-                            results["success"] += 1
-                        else:
-                            results["failed"] += 1
-                            results["errors"][file_path] = "Checksum mismatch"
-                    except Exception as e:
-                        results["failed"] += 1
-                        results["errors"][file_path] = str(e)
-
-                    pbar.update(1)
+            # hashlib releases the GIL while hashing, so threads parallelize without IPC overhead
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                batches = self._split_batches(files)
+                for batch, (n_success, errors) in zip(
+                    batches, executor.map(self._verify_batch, batches)
+                ):
+                    results["success"] += n_success
+                    results["failed"] += len(errors)
+                    results["errors"].update(errors)
+
+                    pbar.update(len(batch))
                     pbar.set_postfix(
                         {"success": results["success"], "failed": results["failed"]}
                     )
 
         return results
 
+    def _is_intact(self, data_file: Path, entry: VerifiedEntry) -> bool:
+        """
+        Check a verified file against its manifest record
+
+        The parallel fingerprint is used when recorded, otherwise the full SHA256 is recomputed.
+
+        Args:
+            data_file: Path to the verified data file
+            entry: Manifest record of the file
+
+        Returns:
+            True if the file content is unchanged since it was verified
+        """
+        if entry.fingerprint is not None:
+            fingerprint = calc_parallel_fingerprint(
+                data_file, threads=self.fingerprint_threads
+            )
+            return fingerprint.hex() == entry.fingerprint
+
+        return calc_checksum(data_file) == self._expected_checksum(data_file, entry)
+
+    @staticmethod
+    def _expected_checksum(data_file: Path, entry: VerifiedEntry) -> bytes:
+        """Get the SHA256 a verified file had, from its manifest record or its CHECKSUM file."""
+        # Records imported from legacy .verified markers carry no checksum
+        if entry.sha256 is not None:
+            return bytes.fromhex(entry.sha256)
+        return read_checksum(get_checksum_file(data_file))
+
+    def _recheck_batch(self, batch: list[Path]) -> list[Path]:
+        """
+        Re-check a group of verified files sequentially inside one worker task
+
+        Intact large files without a fingerprint get one recorded, so their next re-check is fast.
+
+        Args:
+            batch: List of verified files to re-check
+
+        Returns:
+            List of files that failed the re-check
+        """
+        files_by_dir: dict[Path, list[Path]] = {}
+        for data_file in batch:
+            files_by_dir.setdefault(data_file.parent, []).append(data_file)
+
+        corrupted_files = []
+        for directory, dir_files in files_by_dir.items():
+            manifest = VerifiedManifest(directory)
+            known_entries = manifest.get_many([f.name for f in dir_files])
+
+            dir_corrupted, fingerprinted = [], []
+            for data_file in dir_files:
+                entry = known_entries.get(data_file.name)
+                if entry is None:
+                    continue
+                try:
+                    if entry.fingerprint is None and entry.size >= FINGERPRINT_MIN_SIZE:
+                        # Check the SHA256 and compute the fingerprint in one read of the file
+                        checksum_value, fingerprint = calc_checksum_and_fingerprint(
+                            data_file, threads=self.fingerprint_threads
+                        )
+                        if checksum_value != self._expected_checksum(data_file, entry):
+                            dir_corrupted.append(data_file)
+                        else:
+                            fingerprinted.append(
+                                entry._replace(fingerprint=fingerprint.hex())
+                            )
+                    elif not self._is_intact(data_file, entry):
+                        dir_corrupted.append(data_file)
+                except Exception as e:
+                    logger.warning(f"Failed to re-check {data_file.name}: {e}")
+                    dir_corrupted.append(data_file)
+
+            # Un-mark them so the next verify_files() pass verifies them in full
+            manifest.remove([f.name for f in dir_corrupted])
+            manifest.mark(fingerprinted)
+            corrupted_files.extend(dir_corrupted)
+        return corrupted_files
+
+    def recheck_files(self, files: list[Path]) -> list[Path]:
+        """
+        Re-check the integrity of already verified files
+
+        Files that fail are removed from the verified manifest, so they are verified again against
+        their CHECKSUM files (and deleted on mismatch if configured) by the next verify_files() call.
+
+        Args:
+            files: List of verified files to re-check
+
+        Returns:
+            List of files that failed the re-check
+        """
+        corrupted_files = []
+        if not files:
+            return corrupted_files
+
+        # Fingerprints hash their blocks on a thread pool of their own, running them inside the
+        # n_jobs workers would oversubscribe the cores
+        large_files, other_files = [], []
+        for data_file in files:
+            try:
+                is_large = data_file.stat().st_size >= FINGERPRINT_MIN_SIZE
+            except OSError:
+                # Let _recheck_batch report the error
+                is_large = False
+            (large_files if is_large else other_files).append(data_file)
+
+        with tqdm(total=len(files), desc="Re-checking files", unit="file") as pbar:
+            with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+                batches = self._split_batches(other_files)
+                for batch, batch_corrupted in zip(
+                    batches, executor.map(self._recheck_batch, batches)
+                ):
+                    corrupted_files.extend(batch_corrupted)
+                    pbar.update(len(batch))
+                    pbar.set_postfix({"corrupted": len(corrupted_files)})
+
+            for data_file in large_files:
+                corrupted_files.extend(self._recheck_batch([data_file]))
+                pbar.update(1)
+                pbar.set_postfix({"corrupted": len(corrupted_files)})
+
+        return corrupted_files
+
     def _cleanup_files(self, data_file: Path) -> None:
         """
         Cleanup files after verification failure
@@ -268,12 +698,9 @@ class ChecksumVerifier:
         Args:
             data_file: Path to the data file that failed verification
         """
-        from bdt_common.log_kit import logger
-
         data_file.unlink(missing_ok=True)
 
-        verified_file = get_verified_file(data_file)
-        verified_file.unlink(missing_ok=True)
+        VerifiedManifest(data_file.parent).remove([data_file.name])
 
         checksum_file = get_checksum_file(data_file)
         checksum_file.unlink(missing_ok=True)
@@ -4,9 +4,11 @@ from typing import Optional
 
 import xmltodict
 from aiohttp import ClientSession
+from tqdm import tqdm
 
 from bdt_common.constants import BINANCE_AWS_PREFIX
 from bdt_common.enums import DataFrequency, DataType, TradeType
+from bdt_common.log_kit import logger
 from bdt_common.network import async_retry_getter
 from bhds.aws.path_builder import AwsPathBuilder, create_path_builder
 
@@ -148,10 +150,6 @@ class AwsClient:
         Returns:
             Dictionary mapping symbol names to their respective file lists
         """
-        from tqdm import tqdm
-
-        from bdt_common.log_kit import logger
-
         result_dict = {}
         total_symbols = len(symbols)
 
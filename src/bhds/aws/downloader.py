@@ -1,16 +1,30 @@
+import asyncio
+import functools
+import hashlib
+import json
 import os
+import secrets
 import shutil
+import socket
 import subprocess
-import tempfile
+import time
+import urllib.error
+import urllib.request
 from pathlib import Path, PurePosixPath
-from typing import Optional
+from typing import Any, Optional
 
-from bdt_common.constants import ARIA2C_QUIET, BINANCE_AWS_DATA_PREFIX
+import aiohttp
+from tqdm import tqdm
+
+from bdt_common.constants import ARIA2C_QUIET, BINANCE_AWS_DATA_PREFIX, HTTP_TIMEOUT_SEC
 from bdt_common.log_kit import logger
+from bhds.aws.checksum import get_checksum_file, read_checksum
+from bhds.aws.verified_manifest import VerifiedEntry, VerifiedManifest
 
 
+@functools.lru_cache(maxsize=1)
 def get_aria2c_exec() -> str:
-    # Check if aria2c exists in the PATH
+    # Check if aria2c exists in the PATH, the result is cached so PATH is only scanned once
     aria2c_path = shutil.which("aria2c")
     if not aria2c_path:
         raise FileNotFoundError(
@@ -19,6 +33,17 @@ def get_aria2c_exec() -> str:
     return aria2c_path
 
 
+def make_parent_dirs(download_infos: list[tuple[str, Path]]) -> None:
+    """
+    Create the parent directories of all local files, each distinct directory only once.
+
+    Args:
+        download_infos: List of tuples containing (aws_url, local_file_path) pairs
+    """
+    for parent in {local_file.parent for _, local_file in download_infos}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+
 def aria2_download_files(
     download_infos: list[tuple[str, Path]], http_proxy: Optional[str] = None
 ) -> int:
@@ -32,38 +57,37 @@ def aria2_download_files(
     Returns:
         int: Exit code from aria2c process (0 for success, non-zero for failure)
     """
-    # Create temporary file containing download URLs and directory mappings for aria2c
-    with tempfile.NamedTemporaryFile(
-        mode="w", delete_on_close=False, prefix="bhds_"
-    ) as aria_file:
-        # Write each download URL and its target directory to the temp file
-        # Also ensure parent directories exist
-        for aws_url, local_file in download_infos:
-            local_file.parent.mkdir(parents=True, exist_ok=True)
-            aria_file.write(f"{aws_url}\n  dir={local_file.parent}\n")
-        aria_file.close()
-
-        # Build aria2c command with optimized settings for parallel downloads
-        aria2c_path = get_aria2c_exec()
-        cmd = [
-            aria2c_path,
-            "-i",
-            aria_file.name,
-            "-j32",  # max concurrent downloads
-            "-x4",  # max connections per file
-        ]
+    make_parent_dirs(download_infos)
 
-        # Add quiet flag if enabled to suppress verbose aria2c logs
-        if ARIA2C_QUIET:
-            cmd.append("-q")
+    # Build aria2c command with optimized settings for parallel downloads,
+    # download URLs and directory mappings are streamed on stdin
+    aria2c_path = get_aria2c_exec()
+    cmd = [
+        aria2c_path,
+        "-i",
+        "-",
+        "-j32",  # max concurrent downloads
+        "-x4",  # max connections per file
+    ]
 
-        # Add proxy configuration if provided
-        if http_proxy is not None:
-            cmd.append(f"--https-proxy={http_proxy}")
+    # Add quiet flag if enabled to suppress verbose aria2c logs
+    if ARIA2C_QUIET:
+        cmd.append("-q")
+
+    # Add proxy configuration if provided
+    if http_proxy is not None:
+        cmd.append(f"--https-proxy={http_proxy}")
 
-        # Execute aria2c download process
-        run_result = subprocess.run(cmd, env={})
-        returncode = run_result.returncode
+    # Execute aria2c download process
+    process = subprocess.Popen(cmd, stdin=subprocess.PIPE, env={})
+    try:
+        with process.stdin:
+            for aws_url, local_file in download_infos:
+                process.stdin.write(f"{aws_url}\n  dir={local_file.parent}\n".encode())
+    except BrokenPipeError:
+        # aria2c exited early, its return code reports the failure
+        pass
+    returncode = process.wait()
     return returncode
 
 
@@ -77,7 +101,208 @@ def find_missings(download_infos: list[tuple[str, Path]]) -> list[tuple[str, Pat
     Returns:
         list[tuple[str, Path]]: Filtered list containing only files that don't exist locally
     """
-    return [(url, path) for url, path in download_infos if not path.exists()]
+    # List each directory once instead of stat-ing every file
+    existing_by_dir: dict[Path, set[str]] = {}
+    missings = []
+    for url, path in download_infos:
+        existing = existing_by_dir.get(path.parent)
+        if existing is None:
+            try:
+                existing = set(os.listdir(path.parent))
+            except (FileNotFoundError, NotADirectoryError):
+                existing = set()
+            existing_by_dir[path.parent] = existing
+
+        if path.name not in existing:
+            missings.append((url, path))
+    return missings
+
+
+def _find_free_port() -> int:
+    """Ask the OS for a currently unused local TCP port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Aria2RpcDaemon:
+    """
+    Long-lived aria2c process driven through its JSON-RPC interface.
+
+    Keeping one aria2c alive across download batches reuses its connection pool instead of paying
+    process startup and TLS handshakes for every batch.
+    """
+
+    def __init__(
+        self,
+        http_proxy: Optional[str] = None,
+        startup_timeout: float = 10,
+        rpc_batch_size: int = 200,
+    ):
+        """
+        Initialize the daemon wrapper, aria2c itself is spawned by start().
+
+        Args:
+            http_proxy: HTTP proxy URL string, or None for no proxy
+            startup_timeout: Seconds to wait for the RPC endpoint to become ready
+            rpc_batch_size: Number of aria2.addUri calls bundled into one system.multicall request
+        """
+        self.http_proxy = http_proxy
+        self.startup_timeout = startup_timeout
+        self.rpc_batch_size = rpc_batch_size
+        self._secret = secrets.token_hex(16)
+        self._rpc_url: Optional[str] = None
+        self._process: Optional[subprocess.Popen] = None
+
+        # Never route local RPC calls through HTTP_PROXY from the environment
+        self._opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """
+        Spawn aria2c in RPC mode and wait until it answers requests.
+
+        Raises:
+            FileNotFoundError: If aria2c is not found in PATH
+            RuntimeError: If the RPC endpoint does not come up within startup_timeout
+        """
+        port = _find_free_port()
+        cmd = [
+            get_aria2c_exec(),
+            "--enable-rpc",
+            f"--rpc-listen-port={port}",
+            f"--rpc-secret={self._secret}",
+            f"--stop-with-process={os.getpid()}",  # never outlive the Python process
+            "-j32",  # max concurrent downloads
+            "-x4",  # max connections per file
+        ]
+
+        # Add quiet flag if enabled to suppress verbose aria2c logs
+        if ARIA2C_QUIET:
+            cmd.append("-q")
+
+        # Add proxy configuration if provided
+        if self.http_proxy is not None:
+            cmd.append(f"--https-proxy={self.http_proxy}")
+
+        self._rpc_url = f"http://127.0.0.1:{port}/jsonrpc"
+        self._process = subprocess.Popen(cmd, env={})
+
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            try:
+                self.call("aria2.getVersion")
+                return
+            except (urllib.error.URLError, ConnectionError):
+                if not self.is_running or time.monotonic() > deadline:
+                    self.close()
+                    raise RuntimeError("aria2c RPC daemon failed to start")
+                time.sleep(0.1)
+
+    def call(self, method: str, *params: Any) -> Any:
+        """
+        Invoke an aria2 JSON-RPC method.
+
+        Args:
+            method: RPC method name, e.g. "aria2.addUri"
+            *params: Method parameters, the secret token is prepended for aria2.* methods
+
+        Returns:
+            The "result" field of the RPC response
+
+        Raises:
+            RuntimeError: If aria2c answers with an RPC error
+        """
+        if method.startswith("aria2."):
+            params = (f"token:{self._secret}", *params)
+        payload = {"jsonrpc": "2.0", "id": "bhds", "method": method, "params": params}
+        request = urllib.request.Request(
+            self._rpc_url,
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+
+        try:
+            with self._opener.open(request, timeout=30) as resp:
+                reply = json.load(resp)
+        except urllib.error.HTTPError as e:
+            # aria2c reports RPC errors with a 4xx status and a JSON body
+            reply = json.load(e)
+
+        if "error" in reply:
+            raise RuntimeError(f"aria2c RPC {method} failed: {reply['error']}")
+        return reply["result"]
+
+    def add_downloads(self, download_infos: list[tuple[str, Path]]) -> None:
+        """
+        Queue downloads on the daemon, bundling aria2.addUri calls into system.multicall requests.
+
+        Args:
+            download_infos: List of tuples containing (aws_url, local_file_path) pairs
+        """
+        token = f"token:{self._secret}"
+        for i in range(0, len(download_infos), self.rpc_batch_size):
+            calls = [
+                {
+                    "methodName": "aria2.addUri",
+                    "params": [token, [aws_url], {"dir": str(local_file.parent)}],
+                }
+                for aws_url, local_file in download_infos[i : i + self.rpc_batch_size]
+            ]
+            self.call("system.multicall", calls)
+
+    def get_stopped_total(self) -> int:
+        """Get the number of downloads finished since the daemon started."""
+        return int(self.call("aria2.getGlobalStat")["numStoppedTotal"])
+
+    def wait_until_idle(
+        self,
+        poll_interval: float = 0.5,
+        total: Optional[int] = None,
+        stopped_before: int = 0,
+    ) -> None:
+        """
+        Block until the daemon has no active or waiting downloads, then drop finished results.
+
+        Args:
+            poll_interval: Seconds between aria2.getGlobalStat polls
+            total: Number of queued downloads, shows a progress bar of finished ones when given
+            stopped_before: get_stopped_total() before the downloads were queued
+        """
+        with tqdm(
+            total=total, desc="Downloading", unit="file", disable=total is None
+        ) as pbar:
+            while True:
+                stat = self.call("aria2.getGlobalStat")
+                # numStopped is capped at --max-download-result, numStoppedTotal is not
+                finished = int(stat["numStoppedTotal"]) - stopped_before
+                pbar.update(finished - pbar.n)
+                if int(stat["numActive"]) == 0 and int(stat["numWaiting"]) == 0:
+                    break
+                time.sleep(poll_interval)
+        self.call("aria2.purgeDownloadResult")
+
+    def close(self) -> None:
+        """Shut down aria2c, killing it if it does not exit in time."""
+        if self._process is None:
+            return
+
+        if self._process.poll() is None:
+            try:
+                self.call("aria2.shutdown")
+            except Exception:
+                self._process.terminate()
+
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+        self._process = None
 
 
 class AwsDownloader:
@@ -89,25 +314,91 @@ class AwsDownloader:
         """
         Initialize the AWS downloader with configuration parameters.
 
+        The aria2c RPC daemon is spawned lazily on the first download and reused for every later
+        batch until close() is called.
+
         Args:
             local_dir: Local directory path where files will be downloaded
             http_proxy: HTTP proxy URL string for downloads, or None for direct connection
         """
         self.local_dir = local_dir
         self.http_proxy = http_proxy
+        self._daemon: Optional[Aria2RpcDaemon] = None
+        self._daemon_failed = False
+
+    def __enter__(self) -> "AwsDownloader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the aria2c RPC daemon if it was started."""
+        if self._daemon is not None:
+            self._daemon.close()
+            self._daemon = None
+
+    def _get_daemon(self) -> Optional[Aria2RpcDaemon]:
+        """
+        Get the running aria2c RPC daemon, starting it on first use.
+
+        Returns:
+            The daemon, or None if it cannot be started and one-shot aria2c runs should be used
+        """
+        if self._daemon is not None and self._daemon.is_running:
+            return self._daemon
+
+        if self._daemon_failed:
+            return None
+
+        daemon = Aria2RpcDaemon(self.http_proxy)
+        try:
+            daemon.start()
+        except RuntimeError as e:
+            logger.warning(f"{e}, falling back to one-shot aria2c runs")
+            self._daemon_failed = True
+            return None
+
+        self._daemon = daemon
+        return daemon
+
+    def _download(self, download_infos: list[tuple[str, Path]]) -> None:
+        """
+        Download files through the RPC daemon, or in one-shot aria2c batches if it is unavailable.
+
+        Args:
+            download_infos: List of tuples containing (aws_url, local_file_path) pairs
+        """
+        daemon = self._get_daemon()
+
+        if daemon is None:
+            # Process downloads in batches to avoid overwhelming the system
+            batch_size = 4096
+            for i in range(0, len(download_infos), batch_size):
+                batch_infos = download_infos[i : i + batch_size]
+                aria2_download_files(batch_infos, self.http_proxy)
+            return
+
+        make_parent_dirs(download_infos)
+        stopped_before = daemon.get_stopped_total()
+        daemon.add_downloads(download_infos)
+        daemon.wait_until_idle(total=len(download_infos), stopped_before=stopped_before)
 
     def aws_download(self, aws_files: list[PurePosixPath], max_tries=3):
         """
-        Download multiple files from AWS S3 with retry logic and batch processing.
+        Download multiple files from AWS S3 with retry logic.
 
         Args:
             aws_files: List of PurePosixPath objects representing AWS S3 file paths
             max_tries: Maximum number of retry attempts for failed downloads (default: 3)
         """
-        # Build list of download information (URL, local path) for all files
+        # Build list of download information (URL, local path) for all files,
+        # concatenating strings once instead of joining Path objects per file
+        url_prefix = f"{BINANCE_AWS_DATA_PREFIX}/"
+        local_prefix = f"{self.local_dir}/"
         download_infos = [
-            (f"{BINANCE_AWS_DATA_PREFIX}/{str(aws_file)}", self.local_dir / aws_file)
-            for aws_file in aws_files
+            (url_prefix + aws_path, Path(local_prefix + aws_path))
+            for aws_path in map(str, aws_files)
         ]
 
         # Retry loop for handling failed downloads
@@ -119,8 +410,171 @@ class AwsDownloader:
             if not missing_infos:
                 break
 
-            # Process downloads in batches to avoid overwhelming the system
-            batch_size = 4096
-            for i in range(0, len(missing_infos), batch_size):
-                batch_infos = missing_infos[i : i + batch_size]
-                aria2_download_files(batch_infos, self.http_proxy)
+            self._download(missing_infos)
+
+
+def _write_chunk(f, hasher, chunk: bytes) -> None:
+    """Hash a downloaded chunk and append it to the file, hashlib releases the GIL while hashing."""
+    hasher.update(chunk)
+    f.write(chunk)
+
+
+class HttpAwsDownloader:
+    """
+    In-process AWS S3 file downloader built on a shared aiohttp session.
+
+    SHA256 of each data file is computed while it is being written, so data files whose CHECKSUM
+    file is available after the download are verified and recorded in the verified manifest
+    without being read a second time.
+    """
+
+    def __init__(
+        self,
+        local_dir: Path,
+        session: aiohttp.ClientSession,
+        http_proxy: Optional[str] = None,
+        max_concurrency: int = 64,
+        chunk_size: int = 1 << 20,
+    ):
+        """
+        Initialize the in-process downloader.
+
+        Args:
+            local_dir: Local directory path where files will be downloaded
+            session: aiohttp ClientSession used for all downloads
+            http_proxy: HTTP proxy URL string for downloads, or None for direct connection
+            max_concurrency: Maximum number of in-flight downloads
+            chunk_size: Size of the chunks streamed from the response to disk
+        """
+        self.local_dir = local_dir
+        self.session = session
+        self.http_proxy = http_proxy
+        self.chunk_size = chunk_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Large archives can take longer than the session's total timeout, only bound idle reads
+        self._timeout = aiohttp.ClientTimeout(total=None, sock_read=HTTP_TIMEOUT_SEC)
+
+    async def _download_file(self, url: str, local_file: Path) -> bytes:
+        """
+        Download one file to a temporary path and move it in place once complete.
+
+        Disk writes and hashing run in worker threads so they never stall the event loop.
+
+        Args:
+            url: Download URL
+            local_file: Local file path
+
+        Returns:
+            Raw SHA256 digest of the downloaded content
+        """
+        tmp_file = local_file.with_name(f"{local_file.name}.part")
+        hasher = hashlib.sha256()
+
+        async with self._semaphore:
+            try:
+                async with self.session.get(
+                    url, proxy=self.http_proxy, timeout=self._timeout
+                ) as resp:
+                    resp.raise_for_status()
+                    f = await asyncio.to_thread(open, tmp_file, "wb")
+                    try:
+                        async for chunk in resp.content.iter_chunked(self.chunk_size):
+                            await asyncio.to_thread(_write_chunk, f, hasher, chunk)
+                    finally:
+                        await asyncio.to_thread(f.close)
+            except BaseException:
+                # Never leave partial downloads behind
+                await asyncio.to_thread(tmp_file.unlink, missing_ok=True)
+                raise
+
+        await asyncio.to_thread(os.replace, tmp_file, local_file)
+        return hasher.digest()
+
+    async def download_batch(
+        self, download_infos: list[tuple[str, Path]]
+    ) -> tuple[dict[Path, bytes], dict[Path, str]]:
+        """
+        Download files concurrently.
+
+        Args:
+            download_infos: List of tuples containing (aws_url, local_file_path) pairs
+
+        Returns:
+            Tuple of (SHA256 checksums of the downloaded files, errors of the failed files)
+        """
+        await asyncio.to_thread(make_parent_dirs, download_infos)
+        results = await asyncio.gather(
+            *(
+                self._download_file(url, local_file)
+                for url, local_file in download_infos
+            ),
+            return_exceptions=True,
+        )
+
+        checksums, errors = {}, {}
+        for (_, local_file), result in zip(download_infos, results):
+            if isinstance(result, BaseException):
+                errors[local_file] = str(result) or type(result).__name__
+            else:
+                checksums[local_file] = result
+        return checksums, errors
+
+    def _mark_verified(self, checksums: dict[Path, bytes]) -> None:
+        """
+        Record downloaded data files whose checksum matches their CHECKSUM file in the manifest.
+
+        Data files without a readable CHECKSUM file or with a mismatch are left to ChecksumVerifier.
+
+        Args:
+            checksums: SHA256 checksums of the downloaded files
+        """
+        entries_by_dir: dict[Path, list[VerifiedEntry]] = {}
+        for local_file, checksum_value in checksums.items():
+            if local_file.suffix == ".CHECKSUM":
+                continue
+            try:
+                if read_checksum(get_checksum_file(local_file)) != checksum_value:
+                    continue
+                entry = VerifiedEntry.from_stat(
+                    local_file.name, local_file.stat(), checksum_value.hex()
+                )
+            except (FileNotFoundError, RuntimeError):
+                continue
+            entries_by_dir.setdefault(local_file.parent, []).append(entry)
+
+        for directory, entries in entries_by_dir.items():
+            VerifiedManifest(directory).mark(entries)
+
+    async def aws_download(
+        self, aws_files: list[PurePosixPath], max_tries=3
+    ) -> dict[Path, str]:
+        """
+        Download multiple files from AWS S3 with retry logic.
+
+        Args:
+            aws_files: List of PurePosixPath objects representing AWS S3 file paths
+            max_tries: Maximum number of retry attempts for failed downloads (default: 3)
+
+        Returns:
+            Errors of the files that still failed after all attempts
+        """
+        url_prefix = f"{BINANCE_AWS_DATA_PREFIX}/"
+        local_prefix = f"{self.local_dir}/"
+        download_infos = [
+            (url_prefix + aws_path, Path(local_prefix + aws_path))
+            for aws_path in map(str, aws_files)
+        ]
+
+        checksums, errors = {}, {}
+        # Filesystem and manifest work is blocking, keep it off the event loop
+        missing_infos = await asyncio.to_thread(find_missings, download_infos)
+        for try_id in range(max_tries):
+            if not missing_infos:
+                break
+
+            batch_checksums, errors = await self.download_batch(missing_infos)
+            checksums.update(batch_checksums)
+            missing_infos = [info for info in missing_infos if info[1] in errors]
+
+        await asyncio.to_thread(self._mark_verified, checksums)
+        return errors
@@ -1,38 +1,113 @@
 """Failed files tracker for managing download retry logic."""
 
 import json
-from pathlib import Path
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path, PurePosixPath
 from typing import Optional
 
+from bdt_common.constants import BINANCE_AWS_DATA_PREFIX
+
+# Tracked URLs all share this prefix, stripping it gives the AWS file path
+PREFIX_SLASH = f"{BINANCE_AWS_DATA_PREFIX}/"
+PLEN = len(PREFIX_SLASH)
+
 
 class FailedFilesTracker:
-    """Tracks failed file downloads and verifications for retry logic."""
+    """Tracks failed file downloads and verifications for retry logic.
+
+    Failures are stored in a single-table SQLite database in WAL mode, so every change is a
+    single row update and several processes can record failures concurrently.
+    """
 
     def __init__(self, tracking_file: Path):
         """Initialize the failed files tracker.
 
         Args:
-            tracking_file: Path to JSON file storing failed file information.
+            tracking_file: Path to SQLite database storing failed file information.
+                A legacy JSON tracker next to it (same name, .json suffix) is imported once.
         """
         self.tracking_file = tracking_file
-        self.failed_files: dict[str, dict] = {}
-        self._load()
+        self.tracking_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Autocommit mode, each statement outside explicit transactions is committed immediately
+        self._conn = sqlite3.connect(
+            self.tracking_file, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS failed ("
+                "path TEXT PRIMARY KEY, error TEXT, url TEXT, checksum_url TEXT, attempts INTEGER)"
+            )
+        self._import_legacy_json()
+
+    @contextmanager
+    def _transaction(self):
+        """Hold the lock and run the enclosed statements in one transaction, rolled back on error.
 
-    def _load(self) -> None:
-        """Load failed files from tracking file."""
-        if self.tracking_file.exists():
+        Without the rollback a failed statement would leave the shared connection inside an open
+        transaction, and every later BEGIN would fail.
+        """
+        with self._lock:
+            self._conn.execute("BEGIN")
             try:
-                with open(self.tracking_file, "r") as f:
-                    self.failed_files = json.load(f)
-            except Exception:
-                # If file is corrupted, start fresh
-                self.failed_files = {}
-
-    def _save(self) -> None:
-        """Save failed files to tracking file."""
-        self.tracking_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.tracking_file, "w") as f:
-            json.dump(self.failed_files, f, indent=2)
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                # COMMIT itself may fail, e.g. when the database stays locked
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+
+    def _import_legacy_json(self) -> None:
+        """Import failed files from a legacy JSON tracker and remove it."""
+        legacy_file = self.tracking_file.with_suffix(".json")
+        if not legacy_file.exists():
+            return
+
+        try:
+            with open(legacy_file, "r") as f:
+                legacy_failed_files: dict[str, dict] = json.load(f)
+        except Exception:
+            # If file is corrupted, start fresh
+            legacy_failed_files = {}
+
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO failed VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        path,
+                        info.get("error"),
+                        info.get("url"),
+                        info.get("checksum_url"),
+                        info.get("attempts", 1),
+                    )
+                    for path, info in legacy_failed_files.items()
+                    # Skip malformed entries instead of failing to open the tracker
+                    if isinstance(info, dict)
+                ],
+            )
+        legacy_file.unlink()
+
+    def _upsert(self, rows: list[tuple[str, str, str, Optional[str]]]) -> None:
+        """Insert failed files in one transaction, bumping attempts of already tracked ones.
+
+        Args:
+            rows: List of (data_file, error, url, checksum_url) tuples.
+        """
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO failed VALUES (?, ?, ?, ?, 1) "
+                "ON CONFLICT(path) DO UPDATE SET error = excluded.error, url = excluded.url, "
+                "checksum_url = excluded.checksum_url, attempts = attempts + 1",
+                rows,
+            )
 
     def add_failed_file(
         self,
@@ -49,15 +124,7 @@ class FailedFilesTracker:
             url: Download URL for the data file.
             checksum_url: Optional download URL for the checksum file.
         """
-        file_key = str(data_file)
-        self.failed_files[file_key] = {
-            "data_file": str(data_file),
-            "error": error,
-            "url": url,
-            "checksum_url": checksum_url,
-            "attempts": self.failed_files.get(file_key, {}).get("attempts", 0) + 1,
-        }
-        self._save()
+        self._upsert([(str(data_file), error, url, checksum_url)])
 
     def add_failed_files_batch(self, failed_files: dict[Path, dict]) -> None:
         """Add multiple failed files at once.
@@ -66,13 +133,12 @@ class FailedFilesTracker:
             failed_files: Dictionary mapping file paths to their failure info
                          (must contain 'error', 'url', and optionally 'checksum_url').
         """
-        for data_file, info in failed_files.items():
-            self.add_failed_file(
-                data_file=data_file,
-                error=info["error"],
-                url=info["url"],
-                checksum_url=info.get("checksum_url"),
-            )
+        self._upsert(
+            [
+                (str(data_file), info["error"], info["url"], info.get("checksum_url"))
+                for data_file, info in failed_files.items()
+            ]
+        )
 
     def get_failed_files(self) -> dict[str, dict]:
         """Get all tracked failed files.
@@ -80,7 +146,21 @@ class FailedFilesTracker:
         Returns:
             Dictionary mapping file paths to their failure information.
         """
-        return self.failed_files.copy()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, error, url, checksum_url, attempts FROM failed"
+            ).fetchall()
+
+        return {
+            path: {
+                "data_file": path,
+                "error": error,
+                "url": url,
+                "checksum_url": checksum_url,
+                "attempts": attempts,
+            }
+            for path, error, url, checksum_url, attempts in rows
+        }
 
     def get_retry_urls(self) -> list[str]:
         """Get list of URLs to retry downloading.
@@ -90,27 +170,42 @@ class FailedFilesTracker:
         Returns:
             List of URLs to download.
         """
+        with self._lock:
+            rows = self._conn.execute("SELECT url, checksum_url FROM failed").fetchall()
+
         urls = []
-        for file_info in self.failed_files.values():
+        for url, checksum_url in rows:
             # Always redownload the data file
-            urls.append(file_info["url"])
+            urls.append(url)
 
             # Also redownload checksum if it exists
-            if file_info.get("checksum_url"):
-                urls.append(file_info["checksum_url"])
+            if checksum_url:
+                urls.append(checksum_url)
 
         return urls
 
+    def get_retry_aws_files(self) -> list[PurePosixPath]:
+        """Get AWS file paths to retry downloading.
+
+        Same files as get_retry_urls(), deduplicated in order and relative to the AWS data prefix.
+
+        Returns:
+            List of AWS file paths to download.
+        """
+        return [
+            PurePosixPath(url[PLEN:])
+            for url in dict.fromkeys(self.get_retry_urls())
+            if url.startswith(PREFIX_SLASH)
+        ]
+
     def remove_file(self, data_file: Path) -> None:
         """Remove a file from the failed files tracker.
 
         Args:
             data_file: Path to the data file to remove.
         """
-        file_key = str(data_file)
-        if file_key in self.failed_files:
-            del self.failed_files[file_key]
-            self._save()
+        with self._lock:
+            self._conn.execute("DELETE FROM failed WHERE path = ?", (str(data_file),))
 
     def clear_successful_files(self, successful_files: list[Path]) -> None:
         """Remove successfully verified files from the tracker.
@@ -118,13 +213,16 @@ class FailedFilesTracker:
         Args:
             successful_files: List of file paths that passed verification.
         """
-        for file_path in successful_files:
-            self.remove_file(file_path)
+        with self._transaction() as conn:
+            conn.executemany(
+                "DELETE FROM failed WHERE path = ?",
+                [(str(file_path),) for file_path in successful_files],
+            )
 
     def clear_all(self) -> None:
         """Clear all failed files from tracker."""
-        self.failed_files = {}
-        self._save()
+        with self._lock:
+            self._conn.execute("DELETE FROM failed")
 
     def get_count(self) -> int:
         """Get the number of tracked failed files.
@@ -132,7 +230,9 @@ class FailedFilesTracker:
         Returns:
             Number of failed files.
         """
-        return len(self.failed_files)
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM failed").fetchone()
+        return count
 
     def has_failed_files(self) -> bool:
         """Check if there are any failed files tracked.
@@ -140,4 +240,8 @@ class FailedFilesTracker:
         Returns:
             True if there are failed files, False otherwise.
         """
-        return len(self.failed_files) > 0
+        with self._lock:
+            (exists,) = self._conn.execute(
+                "SELECT EXISTS (SELECT 1 FROM failed)"
+            ).fetchone()
+        return bool(exists)
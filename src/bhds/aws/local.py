@@ -5,11 +5,12 @@ This module provides utilities for managing local AWS data files, including
 verification status tracking and file categorization.
 """
 
+import os
 from pathlib import Path
 from typing import Dict, List, Tuple
 
-from bhds.aws.checksum import get_verified_file
 from bhds.aws.path_builder import AwsPathBuilder
+from bhds.aws.verified_manifest import VerifiedEntry, VerifiedManifest
 
 
 class AwsDataFileManager:
@@ -17,7 +18,7 @@ class AwsDataFileManager:
     Manager for AWS data files that handles file verification status tracking.
     
     This class provides utilities to manage and categorize AWS data files based on
-    their verification status using .verified marker files.
+    their verification status using the per-directory verified manifest.
     """
     
     def __init__(self, base_dir: Path):
@@ -33,20 +34,48 @@ class AwsDataFileManager:
         """
         Get both verified and unverified ZIP files from the base directory.
         
-        Scans the base directory for .zip files and categorizes them based on the corresponding .verified marker file.
+        Scans the base directory for .zip files and categorizes them based on the directory's verified manifest.
+        Legacy .verified marker files are imported into the manifest and removed.
         
         Returns:
             Tuple of (verified_files, unverified_files) where:
-            - verified_files: List of .zip files that have .verified markers
-            - unverified_files: List of .zip files without .verified markers
+            - verified_files: List of .zip files recorded in the manifest and unchanged since verified
+            - unverified_files: List of .zip files not verified yet
         """
-        verified_files, unverified_files = [], []
-        for kline_file in self.base_dir.glob("*.zip"):
-            verify_file = get_verified_file(kline_file)
-            if verify_file.exists():
+        if not self.base_dir.is_dir():
+            return [], []
+
+        manifest = VerifiedManifest(self.base_dir)
+        verified_entries = manifest.load()
+
+        zip_entries, legacy_markers = [], []
+        with os.scandir(self.base_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".zip"):
+                    zip_entries.append(entry)
+                elif entry.name.endswith(".zip.verified"):
+                    legacy_markers.append(entry)
+
+        zip_names = {entry.name for entry in zip_entries}
+        legacy_names = {marker.name.removesuffix(".verified") for marker in legacy_markers} & zip_names
+
+        verified_files, unverified_files, imported = [], [], []
+        for entry in zip_entries:
+            kline_file = Path(entry.path)
+            record = verified_entries.get(entry.name)
+            if record is not None and record.matches(entry.stat()):
+                verified_files.append(kline_file)
+            elif entry.name in legacy_names:
+                imported.append(VerifiedEntry.from_stat(entry.name, entry.stat(), None))
                 verified_files.append(kline_file)
             else:
                 unverified_files.append(kline_file)
+
+        if legacy_markers:
+            manifest.mark(imported)
+            for marker in legacy_markers:
+                Path(marker.path).unlink(missing_ok=True)
+
         return verified_files, unverified_files
 
     def get_verified_files(self) -> List[Path]:
@@ -110,13 +139,12 @@ class LocalAwsClient:
             Sorted list of symbol names as strings
         """
         base_path = self.base_dir / self.path_builder.base_dir
-        if not base_path.exists():
+        if not base_path.is_dir():
             return []
         
-        symbols = []
-        for item in base_path.iterdir():
-            if item.is_dir():
-                symbols.append(item.name)
+        # DirEntry.is_dir() uses the file type from the directory listing, no stat per entry
+        with os.scandir(base_path) as it:
+            symbols = [entry.name for entry in it if entry.is_dir()]
         
         return sorted(symbols)
     
@@ -131,12 +159,11 @@ class LocalAwsClient:
             List of Path objects representing data file paths
         """
         symbol_dir = self.get_symbol_dir(symbol)
-        if not symbol_dir.exists():
+        if not symbol_dir.is_dir():
             return []
         
-        files = []
-        for file_path in symbol_dir.glob("*.zip"):
-            files.append(file_path)
+        with os.scandir(symbol_dir) as it:
+            files = [Path(entry.path) for entry in it if entry.name.endswith(".zip")]
         
         return sorted(files)
     
@@ -151,12 +178,9 @@ class LocalAwsClient:
             Dictionary with 'verified' and 'unverified' keys containing lists of file paths
         """
         symbol_dir = self.get_symbol_dir(symbol)
-        if not symbol_dir.exists():
-            return {"verified": [], "unverified": []}
         
-        manager = AwsDataFileManager(symbol_dir)
-        verified_files = manager.get_verified_files()
-        unverified_files = manager.get_unverified_files()
+        # A single directory scan yields both lists
+        verified_files, unverified_files = AwsDataFileManager(symbol_dir).get_files()
         
         return {
             "verified": verified_files,
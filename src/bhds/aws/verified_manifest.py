@@ -0,0 +1,191 @@
+"""
+Verification manifest for AWS data files.
+
+Each data directory keeps a single SQLite manifest of the files that passed checksum verification,
+instead of one .verified marker file per data file.
+"""
+
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from bdt_common.log_kit import logger
+
+MANIFEST_FILE_NAME = ".verified.db"
+
+# Bumped whenever columns are added to the verified table
+SCHEMA_VERSION = 1
+
+# (path, inode) of manifest databases whose schema this process already set up, so later
+# connections skip the setup. The inode tells a deleted and recreated database apart.
+_initialized_db_files: set[tuple[Path, int]] = set()
+
+
+class VerifiedEntry(NamedTuple):
+    """Manifest record of a verified data file."""
+
+    name: str
+    mtime_ns: int
+    size: int
+    sha256: Optional[str]
+    fingerprint: Optional[str] = None
+
+    def matches(self, stat_result: os.stat_result) -> bool:
+        """Check whether the data file is unchanged since it was verified."""
+        return (
+            self.mtime_ns == stat_result.st_mtime_ns
+            and self.size == stat_result.st_size
+        )
+
+    @classmethod
+    def from_stat(
+        cls,
+        name: str,
+        stat_result: os.stat_result,
+        sha256: Optional[str],
+        fingerprint: Optional[str] = None,
+    ) -> "VerifiedEntry":
+        """Create a manifest record from the stat result of a data file."""
+        return cls(
+            name, stat_result.st_mtime_ns, stat_result.st_size, sha256, fingerprint
+        )
+
+
+class VerifiedManifest:
+    """
+    Verified files of one data directory, stored in a SQLite database inside that directory.
+
+    Files are keyed by name together with the mtime and size they had when verified, so a file
+    modified after verification is no longer treated as verified.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Initialize the manifest of a data directory.
+
+        Args:
+            directory: Directory containing the data files
+        """
+        self.directory = Path(directory)
+        self.db_file = self.directory / MANIFEST_FILE_NAME
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the manifest database, setting up the schema on the first connection."""
+        conn = sqlite3.connect(self.db_file, isolation_level=None, timeout=30)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # sqlite3.connect() has created the file if it was missing
+        key = (self.db_file, os.stat(self.db_file).st_ino)
+        if key not in _initialized_db_files:
+            self._init_schema(conn)
+            _initialized_db_files.add(key)
+        return conn
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection) -> None:
+        """Enable WAL, which persists in the database file, and create or upgrade the table."""
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS verified (name TEXT PRIMARY KEY, "
+            "mtime_ns INTEGER, size INTEGER, sha256 TEXT, fingerprint TEXT)"
+        )
+
+        # Manifests created before the fingerprint column existed
+        (user_version,) = conn.execute("PRAGMA user_version").fetchone()
+        if user_version < SCHEMA_VERSION:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(verified)")}
+            if "fingerprint" not in columns:
+                conn.execute("ALTER TABLE verified ADD COLUMN fingerprint TEXT")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def load(self) -> dict[str, VerifiedEntry]:
+        """
+        Load all manifest records.
+
+        The manifest is a cache, so an unreadable one is treated as empty and every file in the
+        directory gets verified again.
+
+        Returns:
+            Dictionary mapping data file names to their manifest records
+        """
+        if not self.db_file.exists():
+            return {}
+
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT name, mtime_ns, size, sha256, fingerprint FROM verified"
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Unreadable verified manifest {self.db_file}: {e}")
+            return {}
+        return {row[0]: VerifiedEntry(*row) for row in rows}
+
+    def get_many(self, names: list[str]) -> dict[str, VerifiedEntry]:
+        """
+        Get the manifest records of several data files with a single query.
+
+        Args:
+            names: Data file names
+
+        Returns:
+            Dictionary mapping the names that are marked as verified to their manifest records
+        """
+        if not names or not self.db_file.exists():
+            return {}
+
+        placeholders = ", ".join("?" * len(names))
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT name, mtime_ns, size, sha256, fingerprint FROM verified "
+                    f"WHERE name IN ({placeholders})",
+                    names,
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Unreadable verified manifest {self.db_file}: {e}")
+            return {}
+        return {row[0]: VerifiedEntry(*row) for row in rows}
+
+    def mark(self, entries: list[VerifiedEntry]) -> None:
+        """
+        Mark data files as verified in one transaction.
+
+        Writes are best-effort: if the manifest cannot be written, the files simply get verified
+        again on the next run.
+
+        Args:
+            entries: Manifest records of the verified files
+        """
+        if not entries:
+            return
+
+        try:
+            with closing(self._connect()) as conn:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO verified VALUES (?, ?, ?, ?, ?)", entries
+                )
+                conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to update verified manifest {self.db_file}: {e}")
+
+    def remove(self, names: list[str]) -> None:
+        """
+        Remove data files from the manifest so they get verified again.
+
+        Unlike mark(), failures are raised: a stale record would let a corrupted file pass as verified.
+
+        Args:
+            names: Data file names
+        """
+        if not names or not self.db_file.exists():
+            return
+
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN")
+            conn.executemany(
+                "DELETE FROM verified WHERE name = ?", [(name,) for name in names]
+            )
+            conn.execute("COMMIT")
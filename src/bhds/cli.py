@@ -27,16 +27,35 @@ def version():
     typer.echo(f"Binance Historical Data Service - Version {__version__}")
 
 
+async def _run_async_task(task_cls, config_path: str):
+    """Create and run a single async task from its config."""
+    await task_cls(config_path).run()
+
+
+def _run_async_tasks(task_cls, config_paths: list[str], task_name: str):
+    """Run async tasks for all configs concurrently in one event loop, exit with code 1 if any of them failed."""
+
+    async def run_all():
+        tasks = [_run_async_task(task_cls, config_path) for config_path in config_paths]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    results = asyncio.run(run_all())
+
+    failed = False
+    for config_path, result in zip(config_paths, results):
+        # CancelledError is a BaseException, not an Exception
+        if isinstance(result, BaseException):
+            logger.error(f"Error running {task_name} task for {config_path}: {result}", exc_info=result)
+            failed = True
+
+    if failed:
+        raise typer.Exit(1)
+
+
 @app.command()
 def aws_download(config_paths: list[str] = typer.Argument(..., help="Paths to YAML configs for AWS download tasks")):
     """Run AWS download tasks from YAML configuration files."""
-    for config_path in config_paths:
-        try:
-            task = AwsDownloadTask(config_path)
-            asyncio.run(task.run())
-        except Exception as e:
-            logger.exception(f"Error running AWS download task for {config_path}: {e}")
-            raise typer.Exit(1)
+    _run_async_tasks(AwsDownloadTask, config_paths, "AWS download")
 
 
 @app.command()
@@ -44,13 +63,7 @@ def parse_aws_data(
     config_paths: list[str] = typer.Argument(..., help="Paths to YAML configs for parse AWS data tasks")
 ):
     """Parse AWS downloaded data from CSV to Parquet with optional API completion."""
-    for config_path in config_paths:
-        try:
-            task = ParseAwsDataTask(config_path)
-            asyncio.run(task.run())
-        except Exception as e:
-            logger.exception(f"Error running parse AWS data task for {config_path}: {e}")
-            raise typer.Exit(1)
+    _run_async_tasks(ParseAwsDataTask, config_paths, "parse AWS data")
 
 
 @app.command()
@@ -5,23 +5,55 @@ BHDS AWS Download Task.
 This module implements the download workflow to fetch historical market data from Binance's official AWS data center.
 It loads a YAML config, resolves symbols, downloads missing files, and optionally verifies checksums.
 """
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from itertools import chain
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+from typing import Optional
+
+import aiohttp
 
 from bdt_common.constants import BINANCE_AWS_DATA_PREFIX, HTTP_TIMEOUT_SEC
 from bdt_common.enums import DataFrequency, DataType, TradeType
 from bdt_common.log_kit import divider, logger
 from bdt_common.network import create_aiohttp_session
-from bhds.aws.checksum import (ChecksumVerifier,
-                               validate_and_cleanup_invalid_checksums)
+from bhds.aws.checksum import (CHECKSUM_MISMATCH, ChecksumVerifier,
+                               cleanup_invalid_checksums,
+                               detect_invalid_checksums)
 from bhds.aws.client import AwsClient, create_aws_client_from_config
-from bhds.aws.downloader import AwsDownloader
+from bhds.aws.downloader import AwsDownloader, HttpAwsDownloader
 from bhds.aws.failed_files import FailedFilesTracker
 from bhds.aws.local import LocalAwsClient
+from bhds.aws.path_builder import AwsPathBuilder
+from bhds.aws.verified_manifest import VerifiedManifest
 from bhds.tasks.common import (create_symbol_filter_from_config, get_bhds_home,
                                load_config)
 
+# Maximum number of concurrent symbol listing requests
+LIST_CONCURRENCY = 32
+
+# Listed files are downloaded in batches of at least this many files, or at least this often
+DOWNLOAD_BATCH_MIN_FILES = 256
+DOWNLOAD_BATCH_INTERVAL_SEC = 0.5
+
+
+def _unlink_if_exists(path: str) -> bool:
+    """Delete a file, returning whether it existed."""
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def _is_own_aws_file(path_builder: AwsPathBuilder, aws_file: PurePosixPath) -> bool:
+    """Check whether an AWS file lies directly in one of the symbol directories of a path builder."""
+    if not aws_file.is_relative_to(path_builder.base_dir):
+        return False
+    symbol = aws_file.relative_to(path_builder.base_dir).parts[0]
+    return aws_file.parent == path_builder.get_symbol_dir(symbol)
+
 
 class AwsDownloadTask:
     """
@@ -48,7 +80,7 @@ class AwsDownloadTask:
 
         # Initialize failed files tracker
         self.failed_files_tracker = FailedFilesTracker(
-            bhds_home / "aws_data" / ".failed_files.json"
+            bhds_home / "aws_data" / ".failed_files.db"
         )
         self.http_proxy = (
             self.config.get("http_proxy")
@@ -56,6 +88,13 @@ class AwsDownloadTask:
             or os.getenv("http_proxy")
         )
         self.use_proxy_for_aria2c = self.config.get("use_proxy_for_aria2c", False)
+        # "aria2c" shells out to aria2c, "aiohttp" downloads in-process and verifies
+        # data files while writing them
+        self.download_backend = self.config.get("download_backend", "aria2c")
+        if self.download_backend not in ("aria2c", "aiohttp"):
+            raise ValueError(
+                f"Invalid download_backend '{self.download_backend}', expected 'aria2c' or 'aiohttp'"
+            )
         logger.info(f"📁 BHDS home: {bhds_home}")
         logger.info(f"📁 Download directory: {self.aws_data_dir}")
         logger.info(
@@ -81,6 +120,11 @@ class AwsDownloadTask:
 
         self.verification_config: dict = self.config.get("checksum_verification")
 
+        # HTTP session owned by the task, opened by __aenter__ or for the duration of run()
+        self._session: Optional[aiohttp.ClientSession] = None
+        # aria2c downloader shared by the retry and download phases, created on first use
+        self._downloader: Optional[AwsDownloader] = None
+
     def _apply_symbol_filter(self, all_symbols: list[str]) -> list[str]:
         """Apply the configured symbol filter to the full symbol list.
 
@@ -114,7 +158,9 @@ class AwsDownloadTask:
         """
         symbols = self.config.get("symbols")
         if symbols:
-            valid = sorted(set(symbols).intersection(set(all_symbols)))
+            # all_symbols is already sorted, filtering it keeps the order without a sort
+            wanted = set(symbols)
+            valid = [symbol for symbol in all_symbols if symbol in wanted]
             logger.info(f"Using {len(valid)} user-specified symbols")
             return valid
 
@@ -125,41 +171,166 @@ class AwsDownloadTask:
         )
         return filtered
 
+    async def _produce_file_lists(
+        self, client: AwsClient, symbols: list[str], queue: asyncio.Queue
+    ) -> None:
+        """List files of all symbols concurrently, queueing each list as soon as it arrives.
+
+        A None sentinel is queued once listing is finished or has failed.
+
+        Args:
+            client: AWS data client used to list files.
+            symbols: Symbols to list.
+            queue: Queue receiving one file list per symbol.
+        """
+        semaphore = asyncio.Semaphore(LIST_CONCURRENCY)
+
+        async def list_symbol(symbol: str) -> list:
+            async with semaphore:
+                return await client.list_data_files(symbol)
+
+        listings = [asyncio.create_task(list_symbol(symbol)) for symbol in symbols]
+        try:
+            for next_listed in asyncio.as_completed(listings):
+                await queue.put(await next_listed)
+        finally:
+            # On failure, stop the remaining listings and collect their results
+            for listing in listings:
+                listing.cancel()
+            await asyncio.gather(*listings, return_exceptions=True)
+            await queue.put(None)
+
+    async def _consume_file_lists(self, queue: asyncio.Queue, download) -> int:
+        """Coalesce queued file lists into download batches.
+
+        A batch is downloaded once it has DOWNLOAD_BATCH_MIN_FILES files or DOWNLOAD_BATCH_INTERVAL_SEC
+        have passed since the last one, whichever comes first. Listing keeps running meanwhile.
+
+        Args:
+            queue: Queue of per-symbol file lists, terminated by None.
+            download: Async callable downloading one batch of AWS file paths.
+
+        Returns:
+            Total number of files submitted for download.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + DOWNLOAD_BATCH_INTERVAL_SEC
+        pending, total_files, finished = [], 0, False
+
+        while not finished:
+            try:
+                files = await asyncio.wait_for(
+                    queue.get(), timeout=max(0, deadline - loop.time())
+                )
+                if files is None:
+                    finished = True
+                else:
+                    pending.extend(files)
+            except asyncio.TimeoutError:
+                pass
+
+            batch_due = finished or loop.time() >= deadline
+            if pending and (batch_due or len(pending) >= DOWNLOAD_BATCH_MIN_FILES):
+                await download(pending)
+                total_files += len(pending)
+                pending = []
+            if batch_due:
+                deadline = loop.time() + DOWNLOAD_BATCH_INTERVAL_SEC
+
+        return total_files
+
     async def _download_files(self, client: AwsClient, symbols: list[str]) -> None:
         """Download data files for the given symbols.
 
-        Lists files via the AWS client, then downloads only the missing files into aws_data_dir.
-        Optionally routes aria2c traffic through an HTTP proxy when enabled.
+        Symbol file lists are fetched concurrently and fed through a queue into download batches,
+        so downloads start while later symbols are still being listed. Only missing files are
+        downloaded into aws_data_dir. Optionally routes downloads through an HTTP proxy when enabled.
 
         Args:
             client: AWS data client used to list and build file paths.
             symbols: Symbols to download.
         """
         logger.info(f"📊 Processing {len(symbols)} symbols...")
-
         logger.info(f"🔍 Fetching file lists for {len(symbols)} symbols from AWS...")
-        files_map = await client.batch_list_data_files(symbols)
 
-        # Log summary
-        total_files = sum(len(files) for files in files_map.values())
+        queue: asyncio.Queue = asyncio.Queue()
+        producer = asyncio.create_task(
+            self._produce_file_lists(client, symbols, queue)
+        )
+        try:
+            if self.download_backend == "aiohttp":
+                downloader = self._create_http_downloader(client)
+                total_files = await self._consume_file_lists(
+                    queue, lambda files: self._download_in_process(downloader, files)
+                )
+            else:
+                downloader = self._get_downloader()
+                # aria2c blocks, run it in a worker thread so listing keeps progressing
+                total_files = await self._consume_file_lists(
+                    queue,
+                    lambda files: asyncio.to_thread(downloader.aws_download, files),
+                )
+            # Surface listing errors
+            await producer
+        finally:
+            producer.cancel()
+
         if total_files == 0:
             logger.warning("No files found")
             return
 
-        logger.info(f"📊 Total: {total_files} files across {len(symbols)} symbols")
+        logger.ok(f"✅ {len(symbols)} symbols saved ({total_files} files)")
+
+    async def _download_in_process(
+        self, downloader: HttpAwsDownloader, files: list
+    ) -> None:
+        """Download a batch of files with the in-process aiohttp downloader.
+
+        Files that still fail after all attempts are tracked for retry on the next run.
+
+        Args:
+            downloader: In-process downloader sharing the task's HTTP session.
+            files: AWS file paths to download.
+        """
+        errors = await downloader.aws_download(files)
+        if not errors:
+            return
 
-        # Only pass http_proxy to AwsDownloader if use_proxy_for_aria2c is True
-        proxy_for_downloader = self.http_proxy if self.use_proxy_for_aria2c else None
-        downloader = AwsDownloader(
-            local_dir=self.aws_data_dir, http_proxy=proxy_for_downloader
+        logger.warning(f"⚠️ {len(errors)} files failed to download")
+        # Track failed CHECKSUM downloads under their data file
+        self._track_failed_files(
+            {
+                (
+                    local_file.with_suffix("")
+                    if local_file.suffix == ".CHECKSUM"
+                    else local_file
+                ): error
+                for local_file, error in errors.items()
+            }
         )
 
-        # Download per symbol and report progress
-        for idx, (symbol, files) in enumerate(files_map.items(), 1):
-            if not files:
-                continue
-            downloader.aws_download(files)
-            logger.ok(f"✅ [{idx}/{len(symbols)}] {symbol} saved ({len(files)} files)")
+    def _track_failed_files(self, failed_files: dict) -> None:
+        """Track failed data files for redownload, together with their checksum files.
+
+        All files are recorded in a single tracker transaction.
+
+        Args:
+            failed_files: Dictionary mapping data file paths to error messages.
+        """
+        # Plain string prefix removal is much cheaper than Path.relative_to per file
+        local_prefix = f"{self.aws_data_dir}{os.sep}"
+        url_prefix = f"{BINANCE_AWS_DATA_PREFIX}/"
+
+        entries = {}
+        for data_file, error in failed_files.items():
+            relative_path = os.fspath(data_file).removeprefix(local_prefix)
+            data_url = url_prefix + relative_path.replace(os.sep, "/")
+            entries[data_file] = {
+                "error": error,
+                "url": data_url,
+                "checksum_url": f"{data_url}.CHECKSUM",
+            }
+        self.failed_files_tracker.add_failed_files_batch(entries)
 
     def _verify_files(self, client: AwsClient) -> None:
         """Verify checksums for downloaded files and optionally delete mismatches.
@@ -169,8 +340,11 @@ class AwsDownloadTask:
         """
         divider("BHDS: Verifying Downloaded Files", sep="-")
 
+        # hashlib hashes through OpenSSL, which already uses SHA-NI where the CPU has it,
+        # so throughput is tuned through the number of files hashed concurrently
         verifier = ChecksumVerifier(
-            delete_mismatch=self.verification_config.get("delete_mismatch", False)
+            delete_mismatch=self.verification_config.get("delete_mismatch", False),
+            n_jobs=self.verification_config.get("n_jobs"),
         )
 
         # Use LocalAwsClient to get all unverified files
@@ -181,31 +355,38 @@ class AwsDownloadTask:
         for symbol_status in all_symbols_status.values():
             all_unverified_files.extend(symbol_status["unverified"])
 
+        # Optional integrity-only pass over files that were verified in earlier runs
+        if self.verification_config.get("recheck_verified", False):
+            all_verified_files = list(
+                chain.from_iterable(
+                    symbol_status["verified"]
+                    for symbol_status in all_symbols_status.values()
+                )
+            )
+            logger.info(f"🔍 Re-checking {len(all_verified_files)} verified files...")
+            corrupted_files = verifier.recheck_files(all_verified_files)
+            if corrupted_files:
+                logger.warning(
+                    f"⚠️ {len(corrupted_files)} verified files changed on disk, verifying them again"
+                )
+                all_unverified_files.extend(corrupted_files)
+
         if all_unverified_files:
             # Fast pre-validation: Find and cleanup invalid checksum files BEFORE full verification
             # This avoids wasting time on expensive SHA256 verification when checksums are empty/corrupt
             logger.info(
                 f"⚡ Pre-validating {len(all_unverified_files)} checksum files..."
             )
-            invalid_checksum_files = validate_and_cleanup_invalid_checksums(
-                all_unverified_files
-            )
+            invalid_checksum_files = detect_invalid_checksums(all_unverified_files)
+            # Broken checksum files are always deleted, unlike data files with mismatches they
+            # hold nothing worth keeping and must be gone for the retry to fetch them again
+            cleanup_invalid_checksums(invalid_checksum_files)
 
             # Track invalid checksum files for redownload
             if invalid_checksum_files:
-                for data_file in invalid_checksum_files:
-                    relative_path = data_file.relative_to(self.aws_data_dir)
-                    data_url = f"{BINANCE_AWS_DATA_PREFIX}/{relative_path}"
-                    checksum_url = f"{data_url}.CHECKSUM"
-
-                    self.failed_files_tracker.add_failed_file(
-                        data_file=data_file,
-                        error="Invalid/empty checksum file",
-                        url=data_url,
-                        checksum_url=checksum_url,
-                    )
+                self._track_failed_files(invalid_checksum_files)
 
-                # Remove invalid files from verification list
+                # Remove invalid files from verification list, dict lookups keep this linear
                 all_unverified_files = [
                     f for f in all_unverified_files if f not in invalid_checksum_files
                 ]
@@ -234,17 +415,13 @@ class AwsDownloadTask:
                 for file_path, error in results["errors"].items():
                     logger.warning(f"  - {file_path}: {error}")
 
-                # Separate checksum mismatches from checksum file issues
-                checksum_mismatches = {
-                    path: error
-                    for path, error in results["errors"].items()
-                    if "Checksum mismatch" in error
-                }
-                checksum_file_issues = {
-                    path: error
-                    for path, error in results["errors"].items()
-                    if "Checksum mismatch" not in error
-                }
+                # Separate checksum mismatches from checksum file issues in a single pass
+                checksum_mismatches, checksum_file_issues = {}, {}
+                for path, error in results["errors"].items():
+                    if error == CHECKSUM_MISMATCH:
+                        checksum_mismatches[path] = error
+                    else:
+                        checksum_file_issues[path] = error
 
                 # Log checksum file issues (these should have been caught in pre-validation!)
                 if checksum_file_issues:
@@ -285,77 +462,123 @@ class AwsDownloadTask:
         Args:
             failed_files: Dictionary mapping file paths to error messages.
         """
-        from pathlib import Path
+        # Track failed files for retry
+        self._track_failed_files(failed_files)
 
-        from bhds.aws.checksum import get_checksum_file, get_verified_file
-
-        for file_path, error in failed_files.items():
+        # Drop the files from the verified manifests, one transaction per directory
+        names_by_dir: dict[Path, list[str]] = {}
+        for file_path in failed_files:
             data_file = Path(file_path)
+            names_by_dir.setdefault(data_file.parent, []).append(data_file.name)
+        for directory, names in names_by_dir.items():
+            VerifiedManifest(directory).remove(names)
+
+        # Delete data and checksum files, unlink releases the GIL so threads overlap the syscalls
+        data_paths = [os.fspath(file_path) for file_path in failed_files]
+        checksum_paths = [f"{data_path}.CHECKSUM" for data_path in data_paths]
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            removed = list(executor.map(_unlink_if_exists, data_paths))
+            list(executor.map(_unlink_if_exists, checksum_paths))
+
+        for data_path, was_removed in zip(data_paths, removed):
+            if was_removed:
+                logger.debug(
+                    f"🗑️  Removed invalid data file: {os.path.basename(data_path)}"
+                )
 
-            # Build URLs for redownload
-            # Convert local path to AWS path
-            relative_path = data_file.relative_to(self.aws_data_dir)
-            data_url = f"{BINANCE_AWS_DATA_PREFIX}/{relative_path}"
-            checksum_url = f"{data_url}.CHECKSUM"
-
-            # Track failed file for retry
-            self.failed_files_tracker.add_failed_file(
-                data_file=data_file,
-                error=error,
-                url=data_url,
-                checksum_url=checksum_url,
-            )
-
-            # Delete data file
-            if data_file.exists():
-                data_file.unlink()
-                logger.debug(f"🗑️  Removed invalid data file: {data_file.name}")
-
-            # Delete verified marker
-            verified_file = get_verified_file(data_file)
-            if verified_file.exists():
-                verified_file.unlink()
+    def _get_retry_aws_files(self, path_builder: AwsPathBuilder) -> list[PurePosixPath]:
+        """Get the AWS paths of this task's tracked failed files (data and checksum files).
 
-            # Delete checksum file
-            checksum_file = get_checksum_file(data_file)
-            if checksum_file.exists():
-                checksum_file.unlink()
+        The tracker is shared by every config, so only files under this task's symbol directories
+        are returned. Tasks running concurrently would otherwise download the same files into the
+        same paths.
 
-    def _retry_failed_files(self) -> None:
-        """Retry downloading previously failed files using aria2c directly."""
+        Args:
+            path_builder: AWS path builder of this task.
+        """
         if not self.failed_files_tracker.has_failed_files():
-            return
+            return []
 
-        failed_count = self.failed_files_tracker.get_count()
-        logger.info(f"🔄 Found {failed_count} previously failed files, retrying...")
+        return [
+            aws_file
+            for aws_file in self.failed_files_tracker.get_retry_aws_files()
+            if _is_own_aws_file(path_builder, aws_file)
+        ]
 
-        # Get URLs to retry (includes both data and checksum files)
-        retry_urls = self.failed_files_tracker.get_retry_urls()
+    async def _retry_failed_files(self, client: AwsClient) -> None:
+        """Retry downloading previously failed files of this task with the configured backend.
 
-        if not retry_urls:
+        Args:
+            client: AWS data client of this task.
+        """
+        aws_files = await asyncio.to_thread(
+            self._get_retry_aws_files, client.path_builder
+        )
+        if not aws_files:
             return
 
-        logger.info(f"📥 Redownloading {len(retry_urls)} files (data + checksums)...")
+        logger.info(
+            f"🔄 Retrying {len(aws_files)} previously failed files (data + checksums)..."
+        )
 
-        # Use downloader to retry with aria2c
-        proxy_for_downloader = self.http_proxy if self.use_proxy_for_aria2c else None
-        downloader = AwsDownloader(
-            local_dir=self.aws_data_dir, http_proxy=proxy_for_downloader
+        if self.download_backend == "aiohttp":
+            errors = await self._create_http_downloader(client).aws_download(aws_files)
+            if errors:
+                logger.warning(f"⚠️ {len(errors)} files failed to download again")
+        else:
+            await asyncio.to_thread(self._get_downloader().aws_download, aws_files)
+        logger.ok(f"✅ Retry download completed for {len(aws_files)} files")
+
+    def _create_http_downloader(self, client: AwsClient) -> HttpAwsDownloader:
+        """Create an in-process downloader sharing the HTTP session of the client."""
+        # Only pass http_proxy to the downloader if use_proxy_for_aria2c is True
+        return HttpAwsDownloader(
+            local_dir=self.aws_data_dir,
+            session=client.session,
+            http_proxy=self.http_proxy if self.use_proxy_for_aria2c else None,
         )
 
-        # Convert URLs back to PurePosixPath format for downloader
-        from pathlib import PurePosixPath
+    def _get_downloader(self) -> AwsDownloader:
+        """Get the aria2c downloader, creating it on first use.
 
-        aws_files = []
-        for url in retry_urls:
-            # Remove prefix to get relative path
-            if url.startswith(BINANCE_AWS_DATA_PREFIX + "/"):
-                relative_path = url[len(BINANCE_AWS_DATA_PREFIX) + 1 :]
-                aws_files.append(PurePosixPath(relative_path))
+        The instance, and the aria2c RPC daemon it starts, is reused by every phase until the task
+        context exits.
+        """
+        if self._downloader is None:
+            # Only pass http_proxy to the downloader if use_proxy_for_aria2c is True
+            self._downloader = AwsDownloader(
+                local_dir=self.aws_data_dir,
+                http_proxy=self.http_proxy if self.use_proxy_for_aria2c else None,
+            )
+        return self._downloader
 
-        if aws_files:
-            downloader.aws_download(aws_files)
-            logger.ok(f"✅ Retry download completed for {len(aws_files)} files")
+    async def __aenter__(self) -> "AwsDownloadTask":
+        """Open the HTTP session shared by every run() until the context exits.
+
+        The aria2c downloader is shut down together with the session.
+        """
+        if self._session is None:
+            self._session = create_aiohttp_session(HTTP_TIMEOUT_SEC)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if self._downloader is not None:
+            # Shutting down aria2c makes blocking RPC calls, keep them off the event loop
+            await asyncio.to_thread(self._downloader.close)
+            self._downloader = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _report_status(self) -> None:
+        """Log whether any files are still tracked as failed."""
+        if self.failed_files_tracker.has_failed_files():
+            logger.warning(
+                f"⚠️ {self.failed_files_tracker.get_count()} files still failing after retry"
+            )
+            logger.warning("💡 Run the command again to retry failed files")
+        else:
+            logger.ok("✅ All files downloaded and verified successfully")
 
     async def run(self):
         """Execute the end-to-end download workflow.
@@ -363,80 +586,59 @@ class AwsDownloadTask:
         Steps:
             1. Check for previously failed files and retry them first.
             2. Auto-detect if only retrying (skip symbol listing for speed).
-            3. Otherwise, create HTTP session and list symbols.
+            3. Otherwise, list symbols.
             4. Download missing files.
             5. Optionally verify checksums.
             6. Track any new failures for next run.
+
+        All HTTP requests go through one session. When the task is not used as an async context
+        manager, the session only lives for this run.
         """
+        if self._session is None:
+            async with self:
+                return await self.run()
+
         divider("BHDS: Start Binance AWS Download", with_timestamp=True)
 
-        # Check if we have failed files to retry
-        has_failed_files = self.failed_files_tracker.has_failed_files()
+        client = create_aws_client_from_config(
+            self.trade_type,
+            self.data_type,
+            self.data_freq,
+            self.config.get("time_interval"),
+            self._session,
+            self.http_proxy,
+        )
 
-        if has_failed_files:
+        # Check if we have failed files to retry
+        if self.failed_files_tracker.has_failed_files():
             # Retry previously failed files first
-            self._retry_failed_files()
+            await self._retry_failed_files(client)
 
             # Smart optimization: If user explicitly set retry_only=true in config, skip symbol listing
             if self.config.get("retry_only", False):
                 logger.info(
                     "⚡ Fast retry mode: Skipping symbol listing (use retry_only=false to disable)"
                 )
-                async with create_aiohttp_session(HTTP_TIMEOUT_SEC) as session:
-                    client = create_aws_client_from_config(
-                        self.trade_type,
-                        self.data_type,
-                        self.data_freq,
-                        self.config.get("time_interval"),
-                        session,
-                        self.http_proxy,
-                    )
-                    if self.verification_config:
-                        self._verify_files(client)
-
-                # Report final status
-                if self.failed_files_tracker.has_failed_files():
-                    logger.warning(
-                        f"⚠️ {self.failed_files_tracker.get_count()} files still failing after retry"
-                    )
-                    logger.warning("💡 Run the command again to retry failed files")
-                else:
-                    logger.ok("✅ All files downloaded and verified successfully")
+                if self.verification_config:
+                    await asyncio.to_thread(self._verify_files, client)
 
+                self._report_status()
                 divider("BHDS: Binance AWS Download Completed", with_timestamp=True)
                 return
 
         # Normal mode: List symbols and download
-        async with create_aiohttp_session(HTTP_TIMEOUT_SEC) as session:
-            client = create_aws_client_from_config(
-                self.trade_type,
-                self.data_type,
-                self.data_freq,
-                self.config.get("time_interval"),
-                session,
-                self.http_proxy,
-            )
-
-            logger.debug("🔍 Fetching available symbols...")
-            all_symbols = await client.list_symbols()
-
-            target_symbols = self._get_target_symbols(all_symbols)
+        logger.debug("🔍 Fetching available symbols...")
+        all_symbols = await client.list_symbols()
 
-            if not target_symbols:
-                logger.warning("⚠️ No symbols to process after filtering")
-                return
+        target_symbols = self._get_target_symbols(all_symbols)
 
-            await self._download_files(client, target_symbols)
-            if self.verification_config:
-                self._verify_files(client)
+        if not target_symbols:
+            logger.warning("⚠️ No symbols to process after filtering")
+            return
 
-        # Report final status
-        if self.failed_files_tracker.has_failed_files():
-            logger.warning(
-                f"⚠️ {self.failed_files_tracker.get_count()} files still failing after retry"
-            )
-            logger.warning("💡 Run the command again to retry failed files")
-        else:
-            logger.ok("✅ All files downloaded and verified successfully")
+        await self._download_files(client, target_symbols)
+        if self.verification_config:
+            await asyncio.to_thread(self._verify_files, client)
 
+        self._report_status()
         divider("BHDS: Binance AWS Download Completed", with_timestamp=True)
@@ -14,6 +14,12 @@ import yaml
 from bdt_common.enums import ContractType, TradeType
 from bdt_common.symbol_filter import BaseSymbolFilter, create_symbol_filter
 
+# Use the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 
 def load_config(config_path: str | Path) -> dict:
     """Load YAML configuration from file path.
@@ -28,7 +34,7 @@ def load_config(config_path: str | Path) -> dict:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_file}")
     with open(config_file, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YamlLoader)
 
 
 def get_bhds_home(bhds_home_cfg: Optional[str] = None) -> Path:
@@ -19,7 +19,7 @@ class FailedFilesTask:
         """Initialize the failed files task."""
         bhds_home = get_bhds_home()
         self.aws_data_dir = bhds_home / "aws_data"
-        self.tracker = FailedFilesTracker(self.aws_data_dir / ".failed_files.json")
+        self.tracker = FailedFilesTracker(self.aws_data_dir / ".failed_files.db")
         
         # Get proxy settings from env
         self.http_proxy = os.getenv("HTTP_PROXY") or os.getenv("http_proxy")
@@ -44,25 +44,12 @@ class FailedFilesTask:
             logger.ok("✅ No failed files to retry.")
             return
 
-        retry_urls = self.tracker.get_retry_urls()
-        logger.info(f"🔄 Retrying {len(retry_urls)} files (data + checksums)...")
-
-        downloader = AwsDownloader(
-            local_dir=self.aws_data_dir,
-            http_proxy=self.http_proxy
-        )
-
-        from pathlib import PurePosixPath
-        from bdt_common.constants import BINANCE_AWS_DATA_PREFIX
-
-        aws_files = []
-        for url in retry_urls:
-            if url.startswith(BINANCE_AWS_DATA_PREFIX + "/"):
-                relative_path = url[len(BINANCE_AWS_DATA_PREFIX) + 1 :]
-                aws_files.append(PurePosixPath(relative_path))
+        aws_files = self.tracker.get_retry_aws_files()
+        logger.info(f"🔄 Retrying {len(aws_files)} files (data + checksums)...")
 
         if aws_files:
-            downloader.aws_download(aws_files)
+            with AwsDownloader(local_dir=self.aws_data_dir, http_proxy=self.http_proxy) as downloader:
+                downloader.aws_download(aws_files)
             logger.ok(f"✅ Retry download completed for {len(aws_files)} files")
             logger.info("💡 Run 'make download' or 'bhds aws-download' to verify the downloaded files.")
 
@@ -6,6 +6,7 @@ Parses downloaded AWS cryptocurrency market data from CSV to optimized Parquet f
 with optional API completion for missing historical data. Supports both klines and
 funding rates data types with configurable symbol filtering.
 """
+import asyncio
 import os
 from pathlib import Path
 from typing import List
@@ -96,7 +97,9 @@ class ParseAwsDataTask:
         """Apply symbol filtering based on config."""
         symbols = self.config.get("symbols")
         if symbols:
-            valid = sorted(set(symbols).intersection(set(all_symbols)))
+            # all_symbols is already sorted, filtering it keeps the order without a sort
+            wanted = set(symbols)
+            valid = [symbol for symbol in all_symbols if symbol in wanted]
             logger.info(f"Using {len(valid)} user-specified symbols")
             return valid
 
@@ -204,7 +207,8 @@ class ParseAwsDataTask:
 
         try:
             # Step 1: Convert CSV to Parquet
-            processed_symbols = self._convert_csv_to_parquet()
+            # Run the blocking conversion in a worker thread so concurrent tasks keep progressing
+            processed_symbols = await asyncio.to_thread(self._convert_csv_to_parquet)
 
             if not processed_symbols:
                 logger.warning("No symbols processed, skipping API completion")
@@ -142,8 +142,8 @@ async def test_checksum_functionality():
                         match = calculated == expected
 
                         logger.debug(f"File: {local_file.name}")
-                        logger.debug(f"  Calculated: {calculated}")
-                        logger.debug(f"  Expected:   {expected}")
+                        logger.debug(f"  Calculated: {calculated.hex()}")
+                        logger.debug(f"  Expected:   {expected.hex()}")
                         if match:
                             logger.ok(f"Status: MATCH")
                         else:
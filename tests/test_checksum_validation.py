@@ -5,11 +5,15 @@ NOT during expensive SHA256 verification.
 
 This prevents deleting valid data files when only the checksum is corrupt.
 """
+import hashlib
 import tempfile
 from pathlib import Path
 
-from bhds.aws.checksum import (ChecksumVerifier, get_checksum_file,
+from bhds.aws.checksum import (ChecksumVerifier, cleanup_invalid_checksums,
+                               detect_invalid_checksums, get_checksum_file,
+                               read_checksum,
                                validate_and_cleanup_invalid_checksums)
+from bhds.aws.verified_manifest import VerifiedEntry, VerifiedManifest
 
 
 def test_empty_checksum_prevalidation():
@@ -40,14 +44,14 @@ def test_empty_checksum_prevalidation():
 
         assert len(invalid_files) == 1, "Should find 1 invalid file"
         assert invalid_files[0] == data_file, "Should identify the test file"
-        assert not data_file.exists(), "Data file should be deleted"
+        assert data_file.exists(), "Data file should be kept, only the checksum is redownloaded"
         assert not checksum_file.exists(), "Checksum file should be deleted"
 
         print("\n✅ TEST PASSED: Empty checksum caught in pre-validation!")
 
 
 def test_missing_checksum_handling():
-    """Test that missing checksums are caught and data files deleted for redownload."""
+    """Test that missing checksums are caught while data files are kept."""
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpdir = Path(tmpdir)
 
@@ -67,7 +71,7 @@ def test_missing_checksum_handling():
         print(f"   Data file exists: {data_file.exists()}")
 
         assert len(invalid_files) == 1, "Should flag file with missing checksum"
-        assert not data_file.exists(), "Data file should be deleted for redownload"
+        assert data_file.exists(), "Data file should be kept, only the checksum is redownloaded"
 
         print("\n✅ TEST PASSED: Missing checksums caught in pre-validation!")
 
@@ -123,12 +127,16 @@ def test_verifier_never_sees_empty_checksums():
         assert f3 in invalid_files, "Whitespace checksum should be caught"
         assert f2 not in invalid_files, "Valid checksum should pass"
 
-        # Now verify that only valid files remain
-        remaining_files = [f for f in files if f.exists()]
+        # Invalid checksum files are deleted, data files are kept for re-verification after redownload
+        assert all(f.exists() for f in files), "Data files should be kept"
+        assert not get_checksum_file(f1).exists(), "Empty checksum file should be deleted"
+        assert not get_checksum_file(f3).exists(), "Whitespace checksum file should be deleted"
+
+        # Only files with valid checksums go on to verification
+        remaining_files = [f for f in files if f not in invalid_files]
         print(f"\n📂 Remaining files: {len(remaining_files)}")
 
-        assert len(remaining_files) == 1, "Only 1 file should remain"
-        assert remaining_files[0] == f2, "Only the valid file should remain"
+        assert remaining_files == [f2], "Only the valid file should remain"
 
         # Now run verification on remaining files
         print("\n🔍 Running ChecksumVerifier on remaining files...")
@@ -186,6 +194,108 @@ def test_corrupt_checksum_file():
         print("\n✅ TEST PASSED: Corrupted checksums handled gracefully!")
 
 
+def test_malformed_digest_prevalidation():
+    """Test that truncated and non-hex digests are caught in pre-validation, bare digests pass."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+
+        data = b"valid data content"
+        digest = hashlib.sha256(data).hexdigest()
+        checksums = {
+            # Truncated digest
+            "truncated.zip": f"{digest[:40]}  truncated.zip\n",
+            # 64 characters, but not hex
+            "non-hex.zip": f"{'z' * 64}  non-hex.zip\n",
+            # Bare digest without a file name is valid
+            "bare.zip": f"{digest}\n",
+        }
+
+        files = {}
+        for name, checksum in checksums.items():
+            data_file = tmpdir / name
+            data_file.write_bytes(data)
+            get_checksum_file(data_file).write_text(checksum)
+            files[name] = data_file
+
+        invalid_files = validate_and_cleanup_invalid_checksums(list(files.values()))
+
+        assert sorted(invalid_files) == sorted([files["truncated.zip"], files["non-hex.zip"]])
+        # Only the malformed checksum files are deleted, data files are kept for re-verification
+        assert not get_checksum_file(files["truncated.zip"]).exists()
+        assert not get_checksum_file(files["non-hex.zip"]).exists()
+        assert get_checksum_file(files["bare.zip"]).exists()
+        assert all(data_file.exists() for data_file in files.values())
+
+        # The bare digest is read as-is by the verifier
+        assert read_checksum(get_checksum_file(files["bare.zip"])) == hashlib.sha256(data).digest()
+        results = ChecksumVerifier().verify_files([files["bare.zip"]])
+        assert results["success"] == 1
+
+
+def test_detect_invalid_checksums_is_read_only():
+    """Test that detection reports the reason for each invalid checksum without deleting anything."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+
+        data = b"valid data content"
+        checksums = {
+            "valid.zip": f"{hashlib.sha256(data).hexdigest()}  valid.zip\n",
+            "empty.zip": "",
+            "truncated.zip": "abc  truncated.zip\n",
+        }
+        files = {}
+        for name, checksum in checksums.items():
+            data_file = tmpdir / name
+            data_file.write_bytes(data)
+            get_checksum_file(data_file).write_text(checksum)
+            files[name] = data_file
+
+        missing = tmpdir / "missing.zip"
+        missing.write_bytes(data)
+        files["missing.zip"] = missing
+
+        before = sorted(tmpdir.iterdir())
+        invalid_files = detect_invalid_checksums(list(files.values()))
+
+        assert invalid_files == {
+            files["empty.zip"]: "Empty checksum file",
+            files["truncated.zip"]: "Invalid checksum file (Invalid checksum length 3)",
+            files["missing.zip"]: "Missing checksum file",
+        }
+        assert sorted(tmpdir.iterdir()) == before, "Detection should not modify any file"
+
+
+def test_cleanup_invalid_checksums():
+    """Test that cleanup deletes the invalid checksum files and un-marks their data files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+
+        data = b"valid data content"
+        invalid_file = tmpdir / "invalid.zip"
+        invalid_file.write_bytes(data)
+        get_checksum_file(invalid_file).write_text("abc  invalid.zip\n")
+
+        # Missing checksum files are fine to clean up too
+        missing = tmpdir / "missing.zip"
+        missing.write_bytes(data)
+
+        valid_file = tmpdir / "valid.zip"
+        valid_file.write_bytes(data)
+        get_checksum_file(valid_file).write_text(hashlib.sha256(data).hexdigest())
+
+        manifest = VerifiedManifest(tmpdir)
+        manifest.mark(
+            [VerifiedEntry.from_stat(f.name, f.stat(), None) for f in (invalid_file, missing, valid_file)]
+        )
+
+        cleanup_invalid_checksums(detect_invalid_checksums([invalid_file, missing, valid_file]))
+
+        assert not get_checksum_file(invalid_file).exists()
+        assert get_checksum_file(valid_file).exists()
+        assert all(f.exists() for f in (invalid_file, missing, valid_file)), "Data files should be kept"
+        assert list(manifest.load()) == ["valid.zip"]
+
+
 if __name__ == "__main__":
     print("=" * 80)
     print("BHDS Checksum Validation Tests")
@@ -207,6 +317,18 @@ if __name__ == "__main__":
     print("-" * 80)
     test_corrupt_checksum_file()
 
+    print("\n[Test 5] Malformed digest pre-validation")
+    print("-" * 80)
+    test_malformed_digest_prevalidation()
+
+    print("\n[Test 6] Read-only invalid checksum detection")
+    print("-" * 80)
+    test_detect_invalid_checksums_is_read_only()
+
+    print("\n[Test 7] Invalid checksum cleanup")
+    print("-" * 80)
+    test_cleanup_invalid_checksums()
+
     print("\n" + "=" * 80)
     print("✅ ALL TESTS PASSED!")
     print("=" * 80)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite failed files tracker used to retry downloads.
+"""
+import json
+import sqlite3
+import tempfile
+from pathlib import Path, PurePosixPath
+
+from bdt_common.constants import BINANCE_AWS_DATA_PREFIX
+from bhds.aws.failed_files import FailedFilesTracker
+
+
+def _url(aws_path: str) -> str:
+    return f"{BINANCE_AWS_DATA_PREFIX}/{aws_path}"
+
+
+def test_import_legacy_json():
+    """Test that a legacy JSON tracker is imported with its attempts and then deleted."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        tracking_file = tmpdir / ".failed_files.db"
+        legacy_file = tmpdir / ".failed_files.json"
+
+        legacy_file.write_text(
+            json.dumps(
+                {
+                    "/aws/a.zip": {
+                        "data_file": "/aws/a.zip",
+                        "error": "Checksum mismatch",
+                        "url": _url("data/a.zip"),
+                        "checksum_url": _url("data/a.zip.CHECKSUM"),
+                        "attempts": 3,
+                    },
+                    "/aws/b.zip": {"error": "Timeout", "url": _url("data/b.zip")},
+                    "/aws/broken.zip": "not a dict",
+                }
+            )
+        )
+
+        tracker = FailedFilesTracker(tracking_file)
+        assert not legacy_file.exists()
+
+        failed_files = tracker.get_failed_files()
+        assert failed_files["/aws/a.zip"]["attempts"] == 3
+        assert failed_files["/aws/a.zip"]["checksum_url"] == _url("data/a.zip.CHECKSUM")
+        assert failed_files["/aws/b.zip"]["attempts"] == 1
+        assert failed_files["/aws/b.zip"]["checksum_url"] is None
+
+        # Reopening finds the imported rows in the database
+        assert FailedFilesTracker(tracking_file).get_count() == 2
+
+
+def test_upsert_bumps_attempts():
+    """Test that recording an already tracked file updates it and bumps its attempts."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracker = FailedFilesTracker(Path(tmpdir) / ".failed_files.db")
+        data_file = Path("/aws/a.zip")
+
+        tracker.add_failed_file(data_file, "Timeout", _url("data/a.zip"))
+        tracker.add_failed_files_batch(
+            {
+                data_file: {
+                    "error": "Checksum mismatch",
+                    "url": _url("data/a.zip"),
+                    "checksum_url": _url("data/a.zip.CHECKSUM"),
+                },
+                Path("/aws/b.zip"): {"error": "Timeout", "url": _url("data/b.zip")},
+            }
+        )
+
+        failed_files = tracker.get_failed_files()
+        assert tracker.get_count() == 2
+        assert failed_files[str(data_file)]["attempts"] == 2
+        assert failed_files[str(data_file)]["error"] == "Checksum mismatch"
+        assert failed_files["/aws/b.zip"]["attempts"] == 1
+
+
+def test_get_retry_aws_files():
+    """Test that retry paths are relative to the AWS prefix, deduplicated and in order."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracker = FailedFilesTracker(Path(tmpdir) / ".failed_files.db")
+        tracker.add_failed_files_batch(
+            {
+                Path("/aws/a.zip"): {
+                    "error": "Checksum mismatch",
+                    "url": _url("data/a.zip"),
+                    "checksum_url": _url("data/a.zip.CHECKSUM"),
+                },
+                # Same URLs tracked under another local path
+                Path("/other/a.zip"): {
+                    "error": "Checksum mismatch",
+                    "url": _url("data/a.zip"),
+                    "checksum_url": _url("data/a.zip.CHECKSUM"),
+                },
+                Path("/aws/b.zip"): {"error": "Timeout", "url": _url("data/b.zip")},
+                Path("/aws/c.zip"): {"error": "Timeout", "url": "https://example.com/c.zip"},
+            }
+        )
+
+        assert tracker.get_retry_aws_files() == [
+            PurePosixPath("data/a.zip"),
+            PurePosixPath("data/a.zip.CHECKSUM"),
+            PurePosixPath("data/b.zip"),
+        ]
+
+
+def test_clear_successful_files():
+    """Test that successfully verified files are removed and the others kept."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracker = FailedFilesTracker(Path(tmpdir) / ".failed_files.db")
+        for name in ("a.zip", "b.zip", "c.zip"):
+            tracker.add_failed_file(Path("/aws") / name, "Timeout", _url(f"data/{name}"))
+
+        tracker.clear_successful_files([Path("/aws/a.zip"), Path("/aws/c.zip"), Path("/aws/x.zip")])
+
+        assert list(tracker.get_failed_files()) == ["/aws/b.zip"]
+        assert tracker.has_failed_files()
+
+        tracker.clear_all()
+        assert not tracker.has_failed_files()
+
+
+def test_failed_write_is_rolled_back():
+    """Test that a failed write leaves the tracker usable and without partial rows."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracker = FailedFilesTracker(Path(tmpdir) / ".failed_files.db")
+
+        try:
+            tracker.add_failed_files_batch(
+                {
+                    Path("/aws/a.zip"): {"error": "Timeout", "url": _url("data/a.zip")},
+                    # Not a type SQLite can store, fails in the middle of the transaction
+                    Path("/aws/b.zip"): {"error": "Timeout", "url": object()},
+                }
+            )
+        except sqlite3.Error:
+            pass
+        else:
+            raise AssertionError("Unsupported parameter type should fail")
+
+        assert not tracker.has_failed_files(), "Partial batch should be rolled back"
+
+        # Later transactions still work
+        tracker.add_failed_file(Path("/aws/c.zip"), "Timeout", _url("data/c.zip"))
+        tracker.clear_successful_files([Path("/aws/x.zip")])
+        assert list(tracker.get_failed_files()) == ["/aws/c.zip"]
+
+
+if __name__ == "__main__":
+    test_import_legacy_json()
+    test_upsert_bumps_attempts()
+    test_get_retry_aws_files()
+    test_clear_successful_files()
+    test_failed_write_is_rolled_back()
+    print("✅ ALL TESTS PASSED!")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test the integrity re-check of already verified files (recheck_verified), including the parallel
+fingerprint recorded for large files.
+
+FINGERPRINT_MIN_SIZE is lowered while the tests run, so small files take the large file path.
+"""
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+import bhds.aws.checksum as checksum
+from bhds.aws.checksum import ChecksumVerifier, get_checksum_file
+from bhds.aws.verified_manifest import VerifiedManifest
+
+
+def _write_data_file(data_file: Path, data: bytes) -> None:
+    """Write a data file together with its CHECKSUM file."""
+    data_file.write_bytes(data)
+    get_checksum_file(data_file).write_text(f"{hashlib.sha256(data).hexdigest()}  {data_file.name}\n")
+
+
+def _with_small_fingerprint_min_size(test):
+    """Run a test with FINGERPRINT_MIN_SIZE lowered to 1 KiB."""
+
+    def wrapper():
+        original = checksum.FINGERPRINT_MIN_SIZE
+        checksum.FINGERPRINT_MIN_SIZE = 1 << 10
+        try:
+            test()
+        finally:
+            checksum.FINGERPRINT_MIN_SIZE = original
+
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+@_with_small_fingerprint_min_size
+def test_fingerprint_uses_multiple_threads():
+    """Test that fingerprints hash blocks on more than one thread with the default config."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        data_file = tmpdir / "large.zip"
+        _write_data_file(data_file, os.urandom(64 << 10))
+
+        verifier = ChecksumVerifier()
+        assert verifier.verify_files([data_file])["success"] == 1
+
+        used_threads = []
+        original = checksum.calc_parallel_fingerprint
+
+        def recording_fingerprint(path, block_mb=64, threads=8):
+            used_threads.append(threads)
+            return original(path, block_mb=block_mb, threads=threads)
+
+        checksum.calc_parallel_fingerprint = recording_fingerprint
+        try:
+            assert verifier.recheck_files([data_file]) == []
+            assert verifier.recheck_files([data_file]) == []
+        finally:
+            checksum.calc_parallel_fingerprint = original
+
+        assert used_threads, "Second re-check should use the recorded fingerprint"
+        assert all(threads > 1 for threads in used_threads), used_threads
+
+
+def test_single_read_matches_separate_hashes():
+    """Test that the single-read checksum and fingerprint match the separately computed ones."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_file = Path(tmpdir) / "large.zip"
+        data = os.urandom((3 << 20) + 123)
+        data_file.write_bytes(data)
+
+        checksum_value, fingerprint = checksum.calc_checksum_and_fingerprint(data_file, block_mb=1)
+        assert checksum_value == hashlib.sha256(data).digest()
+        assert fingerprint == checksum.calc_parallel_fingerprint(data_file, block_mb=1)
+
+
+@_with_small_fingerprint_min_size
+def test_recheck_records_fingerprint():
+    """Test that the first re-check of a large file records its fingerprint, later ones pass with it."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        data_file = tmpdir / "large.zip"
+        _write_data_file(data_file, os.urandom(64 << 10))
+
+        verifier = ChecksumVerifier()
+        assert verifier.verify_files([data_file])["success"] == 1
+        assert VerifiedManifest(tmpdir).load()["large.zip"].fingerprint is None
+
+        # First re-check verifies the SHA256 and records the fingerprint
+        assert verifier.recheck_files([data_file]) == []
+        entry = VerifiedManifest(tmpdir).load()["large.zip"]
+        assert entry.fingerprint == checksum.calc_parallel_fingerprint(data_file).hex()
+
+        # Intact file passes the fingerprint re-check and stays verified
+        assert verifier.recheck_files([data_file]) == []
+        assert "large.zip" in VerifiedManifest(tmpdir).load()
+
+
+@_with_small_fingerprint_min_size
+def test_recheck_detects_same_size_corruption():
+    """Test that a corrupted file with unchanged size and mtime fails the re-check and is un-marked."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        data_file = tmpdir / "large.zip"
+        small_file = tmpdir / "small.zip"
+        _write_data_file(data_file, os.urandom(64 << 10))
+        _write_data_file(small_file, b"small data")
+
+        verifier = ChecksumVerifier()
+        assert verifier.verify_files([data_file, small_file])["success"] == 2
+        assert verifier.recheck_files([data_file, small_file]) == []
+
+        # Flip bytes in place, then restore the mtime so only the content differs
+        for corrupted_file in (data_file, small_file):
+            stat_result = corrupted_file.stat()
+            with open(corrupted_file, "r+b") as f:
+                f.seek(5)
+                f.write(b"XX")
+            os.utime(corrupted_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+            assert corrupted_file.stat().st_size == stat_result.st_size
+
+        corrupted_files = verifier.recheck_files([data_file, small_file])
+        assert sorted(corrupted_files) == [data_file, small_file]
+        assert VerifiedManifest(tmpdir).load() == {}
+
+        # The next verification catches the mismatch against the CHECKSUM file
+        results = verifier.verify_files([data_file, small_file])
+        assert results["failed"] == 2
+
+
+if __name__ == "__main__":
+    test_fingerprint_uses_multiple_threads()
+    test_single_read_matches_separate_hashes()
+    test_recheck_records_fingerprint()
+    test_recheck_detects_same_size_corruption()
+    print("✅ ALL TESTS PASSED!")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Test the per-directory verified manifest that replaced the .verified marker files.
+"""
+import os
+import sqlite3
+import tempfile
+from contextlib import closing
+from pathlib import Path
+
+from bhds.aws.local import AwsDataFileManager
+from bhds.aws.verified_manifest import (MANIFEST_FILE_NAME, SCHEMA_VERSION,
+                                        VerifiedEntry, VerifiedManifest)
+
+
+def _write_file(path: Path, data: bytes) -> VerifiedEntry:
+    """Write a data file and return a manifest record matching it."""
+    path.write_bytes(data)
+    return VerifiedEntry.from_stat(path.name, path.stat(), "ab" * 32)
+
+
+def test_mark_get_many_remove():
+    """Test that marked files are returned by get_many/load until removed."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        manifest = VerifiedManifest(tmpdir)
+
+        # Nothing is marked yet, and no database is created just by reading
+        assert manifest.get_many(["a.zip"]) == {}
+        assert manifest.load() == {}
+        assert not (tmpdir / MANIFEST_FILE_NAME).exists()
+
+        entry_a = _write_file(tmpdir / "a.zip", b"data a")
+        entry_b = _write_file(tmpdir / "b.zip", b"data b")
+        manifest.mark([entry_a, entry_b])
+
+        assert manifest.get_many(["a.zip", "c.zip"]) == {"a.zip": entry_a}
+        assert manifest.load() == {"a.zip": entry_a, "b.zip": entry_b}
+
+        # A fresh instance reads the same database
+        manifest.remove(["a.zip"])
+        assert VerifiedManifest(tmpdir).load() == {"b.zip": entry_b}
+
+
+def test_changed_file_invalidates_entry():
+    """Test that a data file modified after verification is no longer verified."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        data_file = tmpdir / "a.zip"
+        entry = _write_file(data_file, b"data a")
+        VerifiedManifest(tmpdir).mark([entry])
+
+        assert entry.matches(data_file.stat())
+        verified_files, unverified_files = AwsDataFileManager(tmpdir).get_files()
+        assert verified_files == [data_file]
+        assert unverified_files == []
+
+        # Same size, different mtime
+        stat_result = data_file.stat()
+        os.utime(data_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10**9))
+        assert not entry.matches(data_file.stat())
+
+        # Different size, original mtime
+        data_file.write_bytes(b"data a, but longer")
+        os.utime(data_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns))
+        assert not entry.matches(data_file.stat())
+
+        verified_files, unverified_files = AwsDataFileManager(tmpdir).get_files()
+        assert verified_files == []
+        assert unverified_files == [data_file]
+
+
+def test_legacy_marker_import():
+    """Test that legacy .zip.verified markers are imported into the manifest and deleted."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        verified_file = tmpdir / "a.zip"
+        verified_file.write_bytes(b"data a")
+        (tmpdir / "a.zip.verified").touch()
+
+        unverified_file = tmpdir / "b.zip"
+        unverified_file.write_bytes(b"data b")
+
+        # Orphan marker without a data file
+        (tmpdir / "c.zip.verified").touch()
+
+        verified_files, unverified_files = AwsDataFileManager(tmpdir).get_files()
+        assert verified_files == [verified_file]
+        assert unverified_files == [unverified_file]
+        assert list(tmpdir.glob("*.verified")) == []
+
+        # Imported records carry no checksum, the CHECKSUM file stays the reference
+        entry = VerifiedManifest(tmpdir).load()["a.zip"]
+        assert entry.sha256 is None
+        assert entry.matches(verified_file.stat())
+
+        # The manifest alone keeps the file verified
+        verified_files, _ = AwsDataFileManager(tmpdir).get_files()
+        assert verified_files == [verified_file]
+
+
+def test_upgrade_manifest_without_fingerprint():
+    """Test that manifests created before the fingerprint column are upgraded in place."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = Path(tmpdir)
+        data_file = tmpdir / "a.zip"
+        data_file.write_bytes(b"data a")
+        stat_result = data_file.stat()
+
+        with closing(sqlite3.connect(tmpdir / MANIFEST_FILE_NAME)) as conn:
+            conn.execute(
+                "CREATE TABLE verified (name TEXT PRIMARY KEY, "
+                "mtime_ns INTEGER, size INTEGER, sha256 TEXT)"
+            )
+            conn.execute(
+                "INSERT INTO verified VALUES (?, ?, ?, ?)",
+                ("a.zip", stat_result.st_mtime_ns, stat_result.st_size, "ab" * 32),
+            )
+            conn.commit()
+
+        manifest = VerifiedManifest(tmpdir)
+        assert manifest.load() == {
+            "a.zip": VerifiedEntry("a.zip", stat_result.st_mtime_ns, stat_result.st_size, "ab" * 32)
+        }
+
+        manifest.mark([VerifiedEntry.from_stat("a.zip", stat_result, "ab" * 32, "cd" * 32)])
+        assert manifest.get_many(["a.zip"])["a.zip"].fingerprint == "cd" * 32
+
+        with closing(sqlite3.connect(tmpdir / MANIFEST_FILE_NAME)) as conn:
+            (user_version,) = conn.execute("PRAGMA user_version").fetchone()
+        assert user_version == SCHEMA_VERSION
+
+
+if __name__ == "__main__":
+    test_mark_get_many_remove()
+    test_changed_file_invalidates_entry()
+    test_legacy_marker_import()
+    test_upgrade_manifest_without_fingerprint()
+    print("✅ ALL TESTS PASSED!")